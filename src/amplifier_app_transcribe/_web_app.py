@@ -12,6 +12,9 @@ from pathlib import Path
 
 import streamlit as st
 
+from amplifier_app_transcribe.pipeline import TranscriptionPipeline
+from amplifier_app_transcribe.state import StateManager
+
 # Configure logging based on verbose flag
 verbose = os.getenv("AMPLIFIER_VERBOSE") == "1"
 if verbose:
@@ -26,16 +29,11 @@ else:
     # Suppress all logging in normal mode
     logging.basicConfig(level=logging.WARNING)
 
-# Page config
-st.set_page_config(
-    page_title="Amplifier Transcribe",
-    page_icon="🎯",
-    layout="wide",
-)
-
-# Custom CSS - Focus on what actually works in Streamlit
-st.markdown(
-    """
+# Custom CSS - Focus on what actually works in Streamlit. Kept as a
+# module constant so reruns re-emit a shared string instead of rebuilding
+# it; caching the emission itself would drop the styles on rerun since
+# Streamlit redraws the page on every script execution.
+_CSS = """
     <style>
     /* Reduce padding where Streamlit allows */
     .main .block-container {
@@ -141,10 +139,39 @@ st.markdown(
         border-color: #E2E8F0;
     }
     </style>
-    """,
-    unsafe_allow_html=True,
+    """
+
+# Page config
+st.set_page_config(
+    page_title="Amplifier Transcribe",
+    page_icon="🎯",
+    layout="wide",
 )
 
+st.markdown(_CSS, unsafe_allow_html=True)
+
+# Cached factories - Streamlit reruns this script on every widget
+# interaction, so build the heavy pipeline objects once per session
+@st.cache_resource
+def _get_state_manager() -> StateManager:
+    return StateManager()
+
+
+@st.cache_data(ttl=3600)
+def _load_text(path: str) -> str:
+    """Read a results file once; reruns reuse the cached string by path."""
+    return Path(path).read_text()
+
+
+@st.cache_resource
+def _get_pipeline(enhance: bool, output_dir: str) -> TranscriptionPipeline:
+    pipeline = TranscriptionPipeline(state_manager=_get_state_manager(), enhance=enhance)
+    if output_dir and output_dir != "~/transcripts":
+        pipeline.storage.output_dir = Path(output_dir).expanduser()
+        pipeline.storage.output_dir.mkdir(parents=True, exist_ok=True)
+    return pipeline
+
+
 # Initialize session state
 if "processing" not in st.session_state:
     st.session_state.processing = False
@@ -314,56 +341,46 @@ if transcribe_button:
     progress_placeholder = st.empty()
 
     try:
-        from amplifier_app_transcribe.pipeline import TranscriptionPipeline
-        from amplifier_app_transcribe.state import StateManager
-
-        # Progress callback
-        def update_progress(stage: str, data: dict):
-            st.session_state.current_stage = stage
-
-        # Create pipeline (with optional question)
-        pipeline = TranscriptionPipeline(
-            state_manager=StateManager(),
-            enhance=enhance,
-            on_progress=update_progress,
-            question=question if question and question.strip() else None,
-        )
-
-        # Override output directory from settings if configured
-        if output_dir and output_dir != "~/transcripts":
-            pipeline.storage.output_dir = Path(output_dir).expanduser()
-            pipeline.storage.output_dir.mkdir(parents=True, exist_ok=True)
+        # Reuse the session-cached pipeline; only the question varies per run
+        pipeline = _get_pipeline(enhance, output_dir)
+        pipeline.question = question if question and question.strip() else None
 
         # Show progress with spinner
         with progress_placeholder.container():
             with st.spinner("Processing..."):
                 # Status display
                 status_col1, status_col2 = st.columns(2)
-
-                # Run pipeline (blocks)
-                success = pipeline.process_video(url)
-
-                # Update elapsed time periodically
-                elapsed = time.time() - st.session_state.start_time
-                status_col1.text(f"⏱️ {elapsed:.1f}s elapsed")
-                status_col2.text(f"Stage: {st.session_state.current_stage}")
-
-        if success:
-            # Load results from disk
-            video_id = pipeline.storage._sanitize_filename(pipeline.state.state.processed_videos[-1].video_id)
-            output_dir_path = pipeline.storage.output_dir / video_id
-
-            # Read files
+                elapsed_text = status_col1.empty()
+                stage_text = status_col2.empty()
+
+                # Run pipeline in the background, rendering stage events live
+                success = False
+                for stage, data in pipeline.stream(url):
+                    if stage == "done":
+                        success = data.get("success", False)
+                        continue
+
+                    st.session_state.current_stage = stage
+                    elapsed = time.time() - st.session_state.start_time
+                    elapsed_text.text(f"⏱️ {elapsed:.1f}s elapsed")
+                    stage_text.text(f"Stage: {stage}")
+
+        if success and pipeline.last_result:
+            # Session state keeps only the output paths - content is loaded
+            # lazily (and cached) when the results tabs render, so reruns
+            # don't re-pickle multi-megabyte transcript strings
+            output_dir_path = Path(pipeline.last_result["output_dir"])
             transcript_file = output_dir_path / "transcript.md"
             insights_file = output_dir_path / "insights.md"
 
-            results = {
-                "transcript": transcript_file.read_text() if transcript_file.exists() else "Transcript not found",
-                "insights": insights_file.read_text() if insights_file.exists() and enhance else None,
+            # The cache is keyed by path and reprocessing a video rewrites
+            # the same files - drop stale content before rendering
+            _load_text.clear()
+            st.session_state.results = {
+                "transcript_path": str(transcript_file) if transcript_file.exists() else None,
+                "insights_path": str(insights_file) if insights_file.exists() and enhance else None,
                 "output_dir": str(output_dir_path),
             }
-
-            st.session_state.results = results
             progress_placeholder.empty()
         else:
             st.session_state.error = "Processing failed. Check logs for details."
@@ -372,36 +389,49 @@ if transcribe_button:
         st.session_state.error = str(e)
 
     finally:
+        # No full-script rerun here - the outcome fragment below picks up
+        # the session state set during processing
         st.session_state.processing = False
-        st.rerun()
 
-# Error display
-if st.session_state.error:
-    st.error(f"❌ {st.session_state.error}")
-    if st.button("Try Again"):
-        st.session_state.error = None
-        st.rerun()
 
-# Results display
-if st.session_state.results:
-    st.markdown('<div class="success-banner">✅ Transcription complete</div>', unsafe_allow_html=True)
-    st.info(f"📁 Saved to: `{st.session_state.results['output_dir']}`")
+# Error and results rendering live in a fragment so interactions inside it
+# (retry/reset buttons) re-render only this subtree, not the whole script
+@st.fragment
+def _render_outcome():
+    # Error display
+    if st.session_state.error:
+        st.error(f"❌ {st.session_state.error}")
+        if st.button("Try Again"):
+            st.session_state.error = None
+            st.rerun(scope="app")
 
-    # Tabbed interface
-    if st.session_state.results["insights"]:
-        tab1, tab2 = st.tabs(["📊 Insights", "📝 Transcript"])
+    # Results display
+    if st.session_state.results:
+        st.markdown('<div class="success-banner">✅ Transcription complete</div>', unsafe_allow_html=True)
+        st.info(f"📁 Saved to: `{st.session_state.results['output_dir']}`")
 
-        with tab1:
-            st.markdown(st.session_state.results["insights"])
+        transcript_path = st.session_state.results["transcript_path"]
+        insights_path = st.session_state.results["insights_path"]
+        transcript_md = _load_text(transcript_path) if transcript_path else "Transcript not found"
 
-        with tab2:
-            st.markdown(st.session_state.results["transcript"])
-    else:
-        st.markdown("### 📝 Transcript")
-        st.markdown(st.session_state.results["transcript"])
-
-    # Reset button
-    if st.button("Process Another"):
-        st.session_state.results = None
-        st.session_state.error = None
-        st.rerun()
+        # Tabbed interface
+        if insights_path:
+            tab1, tab2 = st.tabs(["📊 Insights", "📝 Transcript"])
+
+            with tab1:
+                st.markdown(_load_text(insights_path))
+
+            with tab2:
+                st.markdown(transcript_md)
+        else:
+            st.markdown("### 📝 Transcript")
+            st.markdown(transcript_md)
+
+        # Reset button
+        if st.button("Process Another"):
+            st.session_state.results = None
+            st.session_state.error = None
+            st.rerun(scope="app")
+
+
+_render_outcome()
@@ -9,88 +9,164 @@ import sys
 from pathlib import Path
 
 import click
-from dotenv import load_dotenv
-from rich.console import Console
-from rich.logging import RichHandler
-from rich.panel import Panel
-from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
-from rich.table import Table
 
-console = Console()
+# Rich and dotenv are imported lazily per branch - cold start of
+# `transcribe --web` should not pay for imports only transcription needs
+_console = None
+
+
+def _get_console():
+    """Create the shared Rich console on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
 
 
 def setup_logging(verbose: bool = False):
     """Configure logging with Rich handler."""
+    from rich.logging import RichHandler
+
     level = logging.DEBUG if verbose else logging.INFO
 
     logging.basicConfig(
         level=level,
         format="%(message)s",
-        handlers=[RichHandler(console=console, rich_tracebacks=True, show_time=False)],
+        handlers=[RichHandler(console=_get_console(), rich_tracebacks=True, show_time=False)],
     )
 
 
-@click.command()
+class _DefaultRunGroup(click.Group):
+    """Group that dispatches bare sources to the `run` subcommand.
+
+    Keeps `transcribe URL [URL...]` working without requiring users to
+    spell out `transcribe run URL`.
+    """
+
+    def resolve_command(self, ctx, args):
+        try:
+            return super().resolve_command(ctx, args)
+        except click.UsageError:
+            # Unknown first token - treat the whole argument list as
+            # sources/options for `run`
+            return "run", self.get_command(ctx, "run"), args
+
+
+@click.group(
+    cls=_DefaultRunGroup,
+    invoke_without_command=True,
+    context_settings={"ignore_unknown_options": True},
+)
+@click.option("--web", is_flag=True, help="Launch web interface in browser (same as `transcribe web`)")
+@click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging")
+@click.pass_context
+def cli(ctx: click.Context, web: bool, verbose: bool):
+    """Transcribe videos and audio files with AI-powered insights.
+
+    SOURCES can be YouTube URLs or local file paths.
+
+    Examples:
+
+        transcribe web  # Launch browser UI
+
+        transcribe https://youtube.com/watch?v=...
+
+        transcribe video.mp4 audio.mp3
+
+        transcribe *.mp4 --resume
+
+        transcribe index  # Generate index only
+    """
+    if web:
+        ctx.invoke(web_cmd, verbose=verbose)
+        # Stop here - otherwise click goes on to invoke the resolved
+        # subcommand once the server exits, silently transcribing any
+        # sources that were on the command line
+        ctx.exit()
+
+    # Make the group-level flag visible to the invoked subcommand, so
+    # `transcribe --verbose URL` behaves like `transcribe run --verbose URL`
+    ctx.ensure_object(dict)
+    ctx.obj["verbose"] = verbose
+
+    if ctx.invoked_subcommand is None:
+        click.echo(ctx.get_help())
+
+
+@cli.command("web")
+@click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging")
+@click.pass_context
+def web_cmd(ctx: click.Context, verbose: bool):
+    """Launch the browser-based web interface."""
+    verbose = verbose or (ctx.obj or {}).get("verbose", False)
+    # Load environment variables (API keys) so the server inherits them
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+    from .web import launch_web_ui
+
+    launch_web_ui(verbose=verbose)
+
+
+@cli.command("index")
+@click.option("--output-dir", type=click.Path(path_type=Path), help="Output directory for transcripts")
+def index_cmd(output_dir: Path | None):
+    """Generate index.md for existing transcripts (no transcription)."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    setup_logging()
+    _generate_index(output_dir)
+
+
+@cli.command("run")
 @click.argument("sources", nargs=-1, required=False)
-@click.option("--web", is_flag=True, help="Launch web interface in browser")
 @click.option("--resume", is_flag=True, help="Resume from last saved state")
+@click.option(
+    "--batch",
+    is_flag=True,
+    help="Batch mode: download all audio first, then transcribe; AI insights use the half-price Message Batches API",
+)
 @click.option("--session-dir", type=click.Path(path_type=Path), help="Session directory for state")
 @click.option("--output-dir", type=click.Path(path_type=Path), help="Output directory for transcripts")
 @click.option("--no-enhance", is_flag=True, help="Skip AI enhancements (summaries/quotes)")
 @click.option("--force-download", is_flag=True, help="Skip cache and re-download audio")
-@click.option("--index-only", is_flag=True, help="Generate index.md only (no transcription)")
 @click.option("--question", "-q", type=str, help="Question to answer in insights overview")
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging")
-def cli(
+@click.pass_context
+def run_cmd(
+    ctx: click.Context,
     sources: tuple[str] | None,
-    web: bool,
     resume: bool,
+    batch: bool,
     session_dir: Path | None,
     output_dir: Path | None,
     no_enhance: bool,
     force_download: bool,
-    index_only: bool,
     question: str | None,
     verbose: bool,
 ):
-    """Transcribe videos and audio files with AI-powered insights.
-
-    SOURCES can be YouTube URLs or local file paths.
-
-    Examples:
-
-        transcribe --web  # Launch browser UI
-
-        transcribe https://youtube.com/watch?v=...
+    """Transcribe the given URLs or local files."""
+    verbose = verbose or (ctx.obj or {}).get("verbose", False)
 
-        transcribe video.mp4 audio.mp3
-
-        transcribe *.mp4 --resume
-
-        transcribe --index-only  # Generate index only
-    """
     # Load environment variables from .env
+    from dotenv import load_dotenv
+
     load_dotenv()
 
     # Setup logging
     setup_logging(verbose)
 
-    # Handle web mode
-    if web:
-        from .web import launch_web_ui
-
-        launch_web_ui(verbose=verbose)
-        return  # launch_web_ui blocks until killed
-
-    # Handle index-only mode
-    if index_only:
-        return _generate_index(output_dir)
+    console = _get_console()
 
     # Require sources for transcription
     if not sources:
         console.print("[red]Error: Provide at least one video URL or audio file[/red]")
         console.print("\nUsage: transcribe URL [URL...] [OPTIONS]")
-        console.print("Or: transcribe --index-only")
+        console.print("Or: transcribe index")
         sys.exit(1)
 
     try:
@@ -110,6 +186,8 @@ def cli(
         from .state import StateManager
 
         # Show banner
+        from rich.panel import Panel
+
         console.print(
             Panel.fit(
                 "[bold cyan]Transcribe[/bold cyan]\nTurn videos into searchable transcripts with AI-powered insights",
@@ -123,11 +201,14 @@ def cli(
         # Create pipeline with enhancement setting
         # Tools initialized internally by pipeline
         enhance = not no_enhance
+        # A prefetch-everything run is a background bulk job, so --batch
+        # also routes AI enhancement through the Message Batches API
         pipeline = TranscriptionPipeline(
             state_manager=state_manager,
             enhance=enhance,
             force_download=force_download,
             question=question,
+            batch_mode=batch,
         )
 
         # Override output directory if specified
@@ -135,13 +216,20 @@ def cli(
             pipeline.storage.output_dir = Path(output_dir).expanduser()
             pipeline.storage.output_dir.mkdir(parents=True, exist_ok=True)
 
+        # Classify sources up front (concurrent stat calls for file lists)
+        urls, files, missing = _classify_sources(list(sources))
+
         # Show configuration
         console.print("\n[cyan]Configuration:[/cyan]")
         console.print(f"  Output: {pipeline.storage.output_dir}")
         console.print(f"  AI Insights: {'Enabled' if enhance else 'Disabled'}")
-        console.print(f"  Sources: {len(sources)} {'file' if len(sources) == 1 else 'files'}")
+        console.print(f"  Sources: {len(urls)} {'URL' if len(urls) == 1 else 'URLs'}, {len(files)} local")
+        for source in missing:
+            console.print(f"  [yellow]⚠ File not found: {source}[/yellow]")
 
         # Run pipeline with progress tracking
+        from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
+
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -153,22 +241,32 @@ def cli(
             # Add overall task
             overall_task = progress.add_task("[cyan]Processing videos...", total=len(sources))
 
-            # Store original logger handlers
-            root_logger = logging.getLogger()
-            original_handlers = root_logger.handlers.copy()
-
-            # Temporarily disable rich logging during processing to show progress bar
-            root_logger.handlers = []
+            # Suppress log output while the progress display is live instead
+            # of swapping out the root handlers (which loses records logged
+            # from worker threads)
+            log_filter = _SuppressWhileLive(progress)
+            handlers = logging.getLogger().handlers
+            for handler in handlers:
+                handler.addFilter(log_filter)
 
             try:
-                success = pipeline.run(list(sources), resume=resume)
+                if batch and len(sources) > 1:
+                    success = pipeline.run_batched(list(sources), resume=resume)
+                elif len(sources) > 1:
+                    import asyncio
+
+                    success = asyncio.run(
+                        pipeline.run_async(list(sources), resume=resume, concurrency=min(len(sources), 8))
+                    )
+                else:
+                    success = pipeline.run(list(sources), resume=resume)
             finally:
-                # Restore logging handlers
-                root_logger.handlers = original_handlers
+                for handler in handlers:
+                    handler.removeFilter(log_filter)
                 progress.update(overall_task, completed=len(sources))
 
         # Show results
-        _show_results(pipeline.state, console)
+        _show_results(pipeline.state)
 
         sys.exit(0 if success else 1)
 
@@ -183,10 +281,52 @@ def cli(
         sys.exit(1)
 
 
+class _SuppressWhileLive(logging.Filter):
+    """Drop log records while a Rich progress display is live."""
+
+    def __init__(self, progress):
+        super().__init__()
+        self._progress = progress
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return not self._progress.live.is_started
+
+
+def _classify_sources(sources: list[str]) -> tuple[list[str], list[str], list[str]]:
+    """Classify sources as URLs, existing files, or missing files.
+
+    Existence checks run through a thread pool so shell-expanded lists
+    (`transcribe *.mp4`) are bounded by disk latency, not count x latency.
+
+    Args:
+        sources: Raw source arguments from the command line
+
+    Returns:
+        Tuple of (urls, files, missing) source lists
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    def classify(source: str) -> tuple[str, str]:
+        if source.startswith("http://") or source.startswith("https://"):
+            return ("url", source)
+        if Path(source).expanduser().exists():
+            return ("file", source)
+        return ("missing", source)
+
+    with ThreadPoolExecutor(max_workers=min(32, len(sources))) as pool:
+        classified = list(pool.map(classify, sources))
+
+    urls = [s for kind, s in classified if kind == "url"]
+    files = [s for kind, s in classified if kind == "file"]
+    missing = [s for kind, s in classified if kind == "missing"]
+    return urls, files, missing
+
+
 def _generate_index(output_dir: Path | None = None) -> int:
     """Generate index.md for all transcripts (internal helper)."""
     from .storage import TranscriptStorage
 
+    console = _get_console()
     storage = TranscriptStorage(output_dir)
 
     if not storage.output_dir.exists():
@@ -212,8 +352,11 @@ def _generate_index(output_dir: Path | None = None) -> int:
     return 0
 
 
-def _show_results(state, console: Console):
+def _show_results(state):
     """Display results summary table."""
+    from rich.table import Table
+
+    console = _get_console()
     console.print("\n")
 
     # Create results table
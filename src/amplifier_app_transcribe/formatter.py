@@ -113,40 +113,63 @@ def _build_continuous_text_with_timestamps(
     if not segments:
         return ""
 
-    text_parts = []
-    last_timestamp_time = 0.0
+    text_parts: list[str] = []
+    next_timestamp = float(timestamp_interval)
+
+    # The link target is the same for every timestamp - resolve it once
+    # instead of re-running both URL regexes per segment
+    video_id = _extract_youtube_id(video_url) if video_url and _is_youtube_url(video_url) else None
+
+    # Bound-method and function lookups hoisted out of the per-segment
+    # loop (runs for every segment of an hours-long transcript)
+    append = text_parts.append
+    fmt = _format_timestamp
 
     for segment in segments:
         # Check if we need a timestamp (every interval)
-        if segment.start >= last_timestamp_time + timestamp_interval:
+        start = segment.start
+        if start >= next_timestamp:
             # Create timestamp link
-            timestamp_str = _format_timestamp(segment.start)
-
-            if video_url and _is_youtube_url(video_url):
-                video_id = _extract_youtube_id(video_url)
-                if video_id:
-                    link = f"https://youtube.com/watch?v={video_id}&t={int(segment.start)}"
-                    timestamp_text = f" [{timestamp_str}]({link})"
-                else:
-                    timestamp_text = f" [{timestamp_str}]"
+            timestamp_str = fmt(start)
+
+            if video_id:
+                append(f" [{timestamp_str}](https://youtube.com/watch?v={video_id}&t={int(start)})")
             else:
-                timestamp_text = f" [{timestamp_str}]"
+                append(f" [{timestamp_str}]")
 
-            text_parts.append(timestamp_text)
-            last_timestamp_time = segment.start
+            next_timestamp = start + timestamp_interval
 
         # Add segment text with space
-        text_parts.append(" " + segment.text.strip())
+        append(" " + segment.text.strip())
 
     return "".join(text_parts).strip()
 
 
+# Sentence boundary = terminal punctuation followed by whitespace; dots
+# inside timestamp URLs never match because they have no trailing space
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+
+# Strips leading timestamp links so the continuation check sees the
+# first real word of the next sentence
+_LINK_STRIP_RE = re.compile(r"\s*\[[^\]]+\](?:\([^)]+\))?\s*")
+
+# Never break a paragraph right before one of these
+_CONTINUATION_WORDS = frozenset(
+    ["but", "and", "so", "because", "however", "although", "while", "yet", "furthermore", "moreover", "therefore", "thus"]
+)
+
+
 def _add_paragraph_breaks(text: str) -> str:
     """Add paragraph breaks every 4-5 sentences without changing content.
 
     Stage 2 of the formatting process: Inserts paragraph breaks (double newlines)
     at natural boundaries without altering the text content.
 
+    One precompiled split plus a linear scan. Matching whole
+    four-sentence runs with a single pattern is tempting but goes
+    quadratic under Python's backtracking engine when the text has no
+    sentence punctuation - exactly what raw ASR output can look like.
+
     Args:
         text: Continuous text with inline timestamps
 
@@ -156,73 +179,40 @@ def _add_paragraph_breaks(text: str) -> str:
     if not text:
         return ""
 
-    # Split on sentence endings while preserving everything
-    # Pattern: look for . ! ? followed by space
-    sentences = re.split(r"(?<=[.!?])\s+", text)
+    sentences = _SENTENCE_SPLIT_RE.split(text)
 
-    result = []
-    sentence_count = 0
-    current_paragraph = []
+    paragraphs: list[str] = []
+    current: list[str] = []
 
     for i, sentence in enumerate(sentences):
-        current_paragraph.append(sentence)
-        sentence_count += 1
-
-        # Add paragraph break after 4-5 sentences
-        if sentence_count >= 4:
-            # Check if next sentence starts with continuation word
-            if i + 1 < len(sentences):
-                next_sentence = sentences[i + 1]
-                # Get first word (ignoring timestamp links)
-                # Remove timestamp pattern first
-                clean_next = re.sub(r"\s*\[[^\]]+\](?:\([^)]+\))?\s*", " ", next_sentence).strip()
-                words = clean_next.split()
-
-                if words:
-                    first_word = words[0].lower()
-
-                    # Don't break before continuations
-                    continuation_words = [
-                        "but",
-                        "and",
-                        "so",
-                        "because",
-                        "however",
-                        "although",
-                        "while",
-                        "yet",
-                        "furthermore",
-                        "moreover",
-                        "therefore",
-                        "thus",
-                    ]
-
-                    if first_word not in continuation_words:
-                        # Join current paragraph and add to result
-                        result.append(" ".join(current_paragraph))
-                        result.append("\n\n")
-                        current_paragraph = []
-                        sentence_count = 0
-            else:
-                # Last sentence, just add it
-                result.append(" ".join(current_paragraph))
+        current.append(sentence)
 
-    # Add any remaining sentences
-    if current_paragraph:
-        result.append(" ".join(current_paragraph))
+        # Break after 4-5 sentences, unless the next one opens with a
+        # continuation word (checked past any leading timestamp link)
+        if len(current) >= 4 and i + 1 < len(sentences):
+            clean_next = _LINK_STRIP_RE.sub(" ", sentences[i + 1]).strip()
+            words = clean_next.split()
+            if words and words[0].lower() not in _CONTINUATION_WORDS:
+                paragraphs.append(" ".join(current))
+                current = []
 
-    return "".join(result)
+    # The final (possibly short) paragraph - appended exactly once, where
+    # the old scan emitted the closing sentence both mid-loop and here
+    if current:
+        paragraphs.append(" ".join(current))
+
+    return "\n\n".join(paragraphs)
 
 
 def _format_duration(seconds: float) -> str:
-    """Format duration as HH:MM:SS or MM:SS."""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
+    """Format duration as HH:MM:SS or MM:SS.
 
-    if hours > 0:
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}"
-    return f"{minutes:02d}:{secs:02d}"
+    Called once per rendered timestamp (hundreds per hour of audio), so
+    the three float mod/floordiv pairs collapse to two integer divmods.
+    """
+    hours, rest = divmod(int(seconds), 3600)
+    minutes, secs = divmod(rest, 60)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}" if hours else f"{minutes:02d}:{secs:02d}"
 
 
 def _format_timestamp(seconds: float) -> str:
@@ -230,15 +220,15 @@ def _format_timestamp(seconds: float) -> str:
     return _format_duration(seconds)
 
 
+# Compiled once - these run per timestamp link, and the domain match
+# replaces four separate lowercase substring scans
+_YT_DOMAIN_RE = re.compile(r"youtube\.com|youtu\.be", re.IGNORECASE)
+_YT_ID_RE = re.compile(r"(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/embed/)([^&\n?#]+)")
+
+
 def _is_youtube_url(url: str) -> bool:
     """Check if URL is from YouTube."""
-    youtube_domains = [
-        "youtube.com",
-        "youtu.be",
-        "www.youtube.com",
-        "m.youtube.com",
-    ]
-    return any(domain in url.lower() for domain in youtube_domains)
+    return _YT_DOMAIN_RE.search(url) is not None
 
 
 def _extract_youtube_id(url: str) -> str | None:
@@ -249,14 +239,5 @@ def _extract_youtube_id(url: str) -> str | None:
     - https://youtu.be/VIDEO_ID
     - https://www.youtube.com/embed/VIDEO_ID
     """
-    # Pattern for various YouTube URL formats
-    patterns = [
-        r"(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/embed/)([^&\n?#]+)",
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-
-    return None
+    match = _YT_ID_RE.search(url)
+    return match.group(1) if match else None
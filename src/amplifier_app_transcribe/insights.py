@@ -4,20 +4,305 @@ Insights Generation Module
 Combines summary generation, quote extraction, and insights formatting.
 """
 
+import functools
+import hashlib
 import json
 import logging
 import os
-from dataclasses import dataclass
+import random
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
 
 try:
-    from anthropic import Anthropic
+    from anthropic import Anthropic, APIConnectionError, APIStatusError
 
     ANTHROPIC_AVAILABLE = True
 except ImportError:
     ANTHROPIC_AVAILABLE = False
 
+# orjson parses/serializes JSON ~2-3x faster than the stdlib; worthwhile
+# for cache traffic on batch runs but strictly optional
+try:
+    import orjson
+
+    def _json_loads(data: str) -> dict | list:
+        return orjson.loads(data)
+
+    def _json_dumps(data: dict | list) -> str:
+        return orjson.dumps(data).decode()
+
+except ImportError:
+
+    def _json_loads(data: str) -> dict | list:
+        return json.loads(data)
+
+    def _json_dumps(data: dict | list) -> str:
+        return json.dumps(data)
+
 logger = logging.getLogger(__name__)
 
+# Static instruction blocks, sent as system prompts with prompt caching
+# enabled. The instructions and format templates are identical across
+# calls, so cached reads (0.1x base input price) mean a multi-video run
+# pays to process them once instead of once per video. Only the per-video
+# title/transcript travels in the user message.
+_SUMMARY_SYSTEM = """Please summarize the transcript provided by the user.
+
+Provide:
+1. A 2-3 sentence overview that captures the essence of the content
+2. 3-5 key takeaways or insights (as bullet points)
+3. 2-4 main themes discussed
+
+Focus on actionable insights and important ideas. Be concise.
+
+Record your summary with the emit_summary tool.
+"""
+
+_SUMMARY_QUESTION_SYSTEM = """IMPORTANT: You are being asked to ANSWER A SPECIFIC QUESTION, not summarize the transcript.
+
+The user's message contains the question and the transcript. Extract and provide the COMPLETE, LITERAL ANSWER from the transcript.
+
+CRITICAL INSTRUCTIONS:
+- If asked for a recipe: Extract ALL ingredients with exact quantities + ALL step-by-step instructions
+- If asked "how does X work": Extract the complete explanation with all details
+- DO NOT summarize - provide the actual content requested
+- DO NOT give an overview - give the literal answer
+- Use the exact information from the transcript, not a high-level description
+
+Record your answer with the emit_summary tool:
+- overview: the COMPLETE, DETAILED answer, not a summary (recipe: ingredients list + numbered steps; explanation: the full explanation; information: the actual data requested)
+- key_points: additional context, tips, or variations mentioned in the video
+- themes: related themes if relevant (may be empty)
+"""
+
+_QUOTE_SYSTEM = """Extract 3-5 memorable, insightful quotes from the transcript provided by the user.
+
+Choose quotes that:
+- Capture key ideas or surprising insights
+- Are complete thoughts (not fragments)
+- Would stand alone as meaningful statements
+- Represent different aspects of the content
+
+For each quote, provide:
+1. The exact quote text
+2. The timestamp (in seconds) when it appears
+3. Context explaining why this quote is significant
+
+Record the quotes with the emit_quotes tool.
+"""
+
+# User-message templates. str.format fills the transcript slice in one
+# copy instead of an f-string re-assembling a ~100 KB literal per call.
+_SUMMARY_QUESTION_USER = """The user asked: "{question}"
+
+Title: {title}
+
+Transcript:
+{transcript}
+"""
+
+_SUMMARY_USER = """Title: {title}
+
+Transcript:
+{transcript}
+"""
+
+_QUOTE_USER = """Transcript:
+{transcript}
+"""
+
+# Tool schemas used to force structured output. tool_choice pins the
+# model to one tool call, so responses parse directly from the tool
+# input instead of through brittle text/JSON-fence scraping, and the
+# model stops spending output tokens on human-formatted prose.
+_SUMMARY_TOOL = {
+    "name": "emit_summary",
+    "description": "Record the structured summary of the transcript.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "overview": {
+                "type": "string",
+                "description": "2-3 sentence overview, or the complete answer when a question was asked",
+            },
+            "key_points": {"type": "array", "items": {"type": "string"}},
+            "themes": {"type": "array", "items": {"type": "string"}},
+        },
+        "required": ["overview", "key_points", "themes"],
+    },
+}
+
+_QUOTES_TOOL = {
+    "name": "emit_quotes",
+    "description": "Record the extracted quotes.",
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "quotes": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "text": {"type": "string"},
+                        "timestamp": {"type": "number", "description": "Seconds into the video"},
+                        "context": {"type": "string"},
+                    },
+                    "required": ["text", "timestamp", "context"],
+                },
+            }
+        },
+        "required": ["quotes"],
+    },
+}
+
+
+# English prose averages ~4 characters per token, so transcript budgets
+# are computed from the model's context window instead of a hardcoded
+# character guess. Counting tokens exactly would need an API round-trip
+# per call (client.messages.count_tokens), which costs more latency than
+# the estimate's error; the ceiling below leaves headroom for drift.
+_CHARS_PER_TOKEN = 4
+_MAX_INPUT_TOKENS = 180_000  # under Haiku 4.5's 200k context window
+
+
+def _transcript_char_budget(system_text: str, max_output_tokens: int) -> int:
+    """Character budget for the transcript portion of a prompt.
+
+    Args:
+        system_text: Static system prompt sent with the call
+        max_output_tokens: Output token budget reserved for the response
+
+    Returns:
+        Maximum transcript slice length in characters
+    """
+    static_tokens = len(system_text) // _CHARS_PER_TOKEN
+    budget_tokens = _MAX_INPUT_TOKENS - static_tokens - max_output_tokens
+    return budget_tokens * _CHARS_PER_TOKEN
+
+
+def _cached_system(text: str) -> list[dict]:
+    """Wrap a system prompt so the API caches it across calls."""
+    return [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
+
+
+# On-disk response cache. Keyed on model + inputs, so reprocessing a
+# video with an unchanged transcript (e.g. after a late-stage failure)
+# skips the Claude round-trip entirely; changing the model invalidates
+# entries automatically. An in-process memo sits in front of the disk
+# layer so a source listed twice in one run (same video in two
+# playlists, a resumed list with duplicates) skips even the file read
+# and JSON parse. Entries are small - summaries and quotes, never
+# transcripts - so the memo is not bounded.
+_CACHE_DIR = Path(".data/insights_cache")
+_memo: dict[str, dict | list] = {}
+
+
+def _cache_key(*parts: str) -> str:
+    """Hash cache key components into a filename-safe digest."""
+    return hashlib.blake2b("\x00".join(parts).encode()).hexdigest()
+
+
+def _cache_get(key: str) -> dict | list | None:
+    """Load a cached response, or None on miss/corruption."""
+    if key in _memo:
+        return _memo[key]
+    try:
+        data = _json_loads((_CACHE_DIR / f"{key}.json").read_text())
+    except (OSError, ValueError):  # JSONDecodeError subclasses ValueError
+        return None
+    _memo[key] = data
+    return data
+
+
+def _cache_put(key: str, data: dict | list) -> None:
+    """Persist a response to the cache; disk failures only log."""
+    _memo[key] = data
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        (_CACHE_DIR / f"{key}.json").write_text(_json_dumps(data))
+    except OSError as e:
+        logger.debug(f"Could not write insights cache: {e}")
+
+
+def _tool_input(content: list) -> dict:
+    """Return the input of the first tool_use block in a response's content.
+
+    Args:
+        content: Message content blocks
+
+    Returns:
+        The tool call's input dict
+
+    Raises:
+        ValueError: If the response contains no tool_use block
+    """
+    tool_input = next((block.input for block in content if getattr(block, "type", None) == "tool_use"), None)
+    if tool_input is None:
+        raise ValueError("Response contained no tool_use block")
+    return tool_input
+
+
+# Default to Claude Haiku 4.5 (Oct 2025) - fastest model with near-frontier intelligence
+_DEFAULT_MODEL = "claude-haiku-4-5-20251001"
+
+
+def _model_for_task(env_var: str) -> str:
+    """Resolve the model for a task: task env var, shared default, Haiku.
+
+    Per-task routing lets cheap bounded tasks stay on Haiku while
+    judgement-heavy ones are upgraded independently.
+    """
+    return os.getenv(env_var) or os.getenv("AMPLIFIER_MODEL_DEFAULT", _DEFAULT_MODEL)
+
+
+# Retry budget for transient API failures (connection drops, 429 rate
+# limits, 5xx overloads). Other status codes raise straight through.
+_RETRY_ATTEMPTS = 5
+_RETRY_MAX_WAIT = 30.0
+
+
+def _call_with_retries(make_request):
+    """Run an API call, retrying transient failures with jittered backoff.
+
+    A single rate-limit or overload blip used to drop a video straight
+    onto the fallback path (placeholder summary, no quotes); retrying
+    recovers those transparently. Non-transient errors still propagate
+    immediately so callers' fallbacks handle them.
+
+    Args:
+        make_request: Zero-argument callable performing the API call
+
+    Returns:
+        Whatever make_request returns
+    """
+    for attempt in range(1, _RETRY_ATTEMPTS + 1):
+        try:
+            return make_request()
+        except APIConnectionError:
+            if attempt == _RETRY_ATTEMPTS:
+                raise
+        except APIStatusError as e:
+            if e.status_code != 429 and e.status_code < 500:
+                raise
+            if attempt == _RETRY_ATTEMPTS:
+                raise
+
+        wait = min(_RETRY_MAX_WAIT, 2 ** (attempt - 1)) * random.uniform(0.5, 1.5)
+        logger.warning(f"Claude call failed (attempt {attempt}/{_RETRY_ATTEMPTS}), retrying in {wait:.1f}s")
+        time.sleep(wait)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_client(api_key: str) -> "Anthropic":
+    """Return a shared Anthropic client for the given API key.
+
+    SummaryGenerator and QuoteExtractor both talk to the same endpoint;
+    sharing one client reuses its connection pool (one TLS handshake,
+    warm keep-alive sockets) across the summary and quote calls.
+    """
+    return Anthropic(api_key=api_key)
+
 
 @dataclass
 class Summary:
@@ -42,12 +327,14 @@ class Quote:
 class SummaryGenerator:
     """Generate concise summaries from transcripts using Claude."""
 
-    def __init__(self, api_key: str | None = None, model: str | None = None):
+    def __init__(self, api_key: str | None = None, model: str | None = None, client: "Anthropic | None" = None):
         """Initialize summary generator.
 
         Args:
             api_key: Anthropic API key. If not provided, reads from ANTHROPIC_API_KEY env var.
-            model: Model to use. If not provided, uses AMPLIFIER_MODEL_DEFAULT or claude-haiku-4-5-20251001.
+            model: Model to use. If not provided, uses AMPLIFIER_MODEL_SUMMARY,
+                then AMPLIFIER_MODEL_DEFAULT, then claude-haiku-4-5-20251001.
+            client: Anthropic client to reuse. If not provided, a shared per-key client is used.
         """
         if not ANTHROPIC_AVAILABLE:
             raise ImportError("anthropic package not available. Install with: pip install anthropic")
@@ -57,15 +344,15 @@ class SummaryGenerator:
         if not self.api_key:
             raise ValueError("ANTHROPIC_API_KEY not set. Please set it in your environment or pass it as a parameter.")
 
-        # Get model from param or environment
-        # Default to Claude Haiku 4.5 (Oct 2025) - fastest model with near-frontier intelligence
-        self.model = model or os.getenv("AMPLIFIER_MODEL_DEFAULT", "claude-haiku-4-5-20251001")
+        # Summary generation is bounded structured extraction - route it
+        # independently so it can stay on Haiku even if quotes move up
+        self.model = model or _model_for_task("AMPLIFIER_MODEL_SUMMARY")
 
-        # Initialize Anthropic client
-        self.client = Anthropic(api_key=self.api_key)
+        # Use the injected client or the shared per-key one
+        self.client = client or _get_client(self.api_key)
 
-    def generate(self, transcript_text: str, title: str, question: str | None = None) -> Summary:
-        """Generate a concise summary from transcript text.
+    def _build_prompt(self, transcript_text: str, title: str, question: str | None = None) -> tuple[str, str, str]:
+        """Build the system/user prompt pair, truncating overly long transcripts.
 
         Args:
             transcript_text: Full transcript text
@@ -73,10 +360,13 @@ class SummaryGenerator:
             question: Optional question to answer in the overview
 
         Returns:
-            Summary object with overview, key points, and themes
+            Tuple of (system, user_content, truncation_note) - the note is ""
+            when nothing was cut
         """
-        # Check if we need to truncate
-        max_chars = 100000  # ~25k tokens for Haiku 4.5's 200k context window
+        # Check if we need to truncate - budget derives from the context
+        # window minus the static prompt and the reserved output tokens
+        system = _SUMMARY_QUESTION_SYSTEM if question else _SUMMARY_SYSTEM
+        max_chars = _transcript_char_budget(system, self._max_tokens(question))
         original_length = len(transcript_text)
         was_truncated = original_length > max_chars
 
@@ -96,103 +386,102 @@ class SummaryGenerator:
 
         # When a question is provided, it becomes the PRIMARY directive
         if question:
-            prompt = f"""IMPORTANT: You are being asked to ANSWER A SPECIFIC QUESTION, not summarize the transcript.
+            user_content = _SUMMARY_QUESTION_USER.format(
+                question=question, title=title, transcript=transcript_text[:max_chars]
+            )
+        else:
+            user_content = _SUMMARY_USER.format(title=title, transcript=transcript_text[:max_chars])
 
-The user asked: "{question}"
+        return system, user_content, truncation_note
 
-Extract and provide the COMPLETE, LITERAL ANSWER from the transcript.
+    def _max_tokens(self, question: str | None) -> int:
+        """Output token budget for a summary call.
 
-CRITICAL INSTRUCTIONS:
-- If asked for a recipe: Extract ALL ingredients with exact quantities + ALL step-by-step instructions
-- If asked "how does X work": Extract the complete explanation with all details
-- DO NOT summarize - provide the actual content requested
-- DO NOT give an overview - give the literal answer
-- Use the exact information from the transcript, not a high-level description
-
-Transcript:
-{transcript_text[:100000]}
-
-Title: {title}
+        Questions need more tokens (they ask for complete literal
+        answers); standard summaries are bounded by the tool schema to a
+        short overview plus two small lists, so a tight cap trims the
+        worst case without touching normal output. Output tokens carry
+        Claude's 5x price premium, so the cap is the cheapest lever.
+        """
+        return 4000 if question else 350
 
-Please respond in this format:
-OVERVIEW:
-[The COMPLETE, DETAILED answer - not a summary.
-If recipe: ingredients list + numbered steps.
-If explanation: the full explanation.
-If information: the actual data requested.]
-
-KEY POINTS:
-- [Additional context or tips from the video]
-- [Important notes or variations mentioned]
-[etc.]
-
-THEMES:
-- [Related themes if relevant]
-[etc. - optional]
-"""
-        else:
-            # Standard summary format when no question provided
-            prompt = f"""Please summarize this transcript titled "{title}".
+    def build_batch_request(
+        self, custom_id: str, transcript_text: str, title: str, question: str | None = None
+    ) -> dict:
+        """Build a Message Batches API request entry for one summary.
 
-Provide:
-1. A 2-3 sentence overview that captures the essence of the content
-2. 3-5 key takeaways or insights (as bullet points)
-3. 2-4 main themes discussed
+        Args:
+            custom_id: Identifier used to match the batch result back
+            transcript_text: Full transcript text
+            title: Title of the video/content
+            question: Optional question to answer in the overview
 
-Focus on actionable insights and important ideas. Be concise.
+        Returns:
+            Request dict for client.messages.batches.create
+        """
+        system, user_content, _ = self._build_prompt(transcript_text, title, question)
+        return {
+            "custom_id": custom_id,
+            "params": {
+                "model": self.model,
+                "max_tokens": self._max_tokens(question),
+                "temperature": 0.3,
+                "system": _cached_system(system),
+                "tools": [_SUMMARY_TOOL],
+                "tool_choice": {"type": "tool", "name": "emit_summary"},
+                "messages": [{"role": "user", "content": user_content}],
+            },
+        }
 
-Transcript:
-{transcript_text[:100000]}
-
-Please respond in this exact format:
-OVERVIEW:
-[Your 2-3 sentence overview here]
-
-KEY POINTS:
-- [Point 1]
-- [Point 2]
-- [Point 3]
-[etc.]
-
-THEMES:
-- [Theme 1]
-- [Theme 2]
-[etc.]
-"""
+    def generate(self, transcript_text: str, title: str, question: str | None = None) -> Summary:
+        """Generate a concise summary from transcript text.
 
-        try:
-            # Use more tokens when answering questions (they need detail)
-            # vs standard summaries (concise by design)
-            # Claude 3 Haiku supports up to 4096 tokens, Claude 3.5 up to 8192
-            max_tokens = 4000 if question else 1500
+        Args:
+            transcript_text: Full transcript text
+            title: Title of the video/content
+            question: Optional question to answer in the overview
 
-            response = self.client.messages.create(
+        Returns:
+            Summary object with overview, key points, and themes
+        """
+        cache_key = _cache_key("summary", self.model, title, question or "", transcript_text)
+        cached = _cache_get(cache_key)
+        if isinstance(cached, dict):
+            logger.info("Using cached summary")
+            return Summary(**cached)
+
+        system, user_content, truncation_note = self._build_prompt(transcript_text, title, question)
+
+        # Stream the response so tokens are consumed as they are generated
+        # instead of buffering server-side until the last token; this also
+        # sidesteps the SDK's long-request timeout for non-streaming calls
+        def _make_request():
+            with self.client.messages.stream(
                 model=self.model,
-                max_tokens=max_tokens,
+                max_tokens=self._max_tokens(question),
                 temperature=0.3,  # Lower temperature for more focused summaries
+                system=_cached_system(system),
+                tools=[_SUMMARY_TOOL],
+                tool_choice={"type": "tool", "name": "emit_summary"},
                 messages=[
                     {
                         "role": "user",
-                        "content": prompt,
+                        "content": user_content,
                     }
                 ],
-            )
+            ) as stream:
+                return stream.get_final_message()
 
-            # Parse the response - extract text from the first text block
-            content = ""
-            for block in response.content:
-                if hasattr(block, "text"):
-                    content = block.text  # type: ignore[attr-defined]
-                    break
-            if not content:
-                content = str(response.content[0])
+        try:
+            response = _call_with_retries(_make_request)
 
-            summary = self._parse_summary(content)
+            summary = self._summary_from_input(_tool_input(response.content))
 
             # Add truncation warning if transcript was truncated
-            if was_truncated:
+            if truncation_note:
                 summary.truncation_warning = truncation_note
 
+            _cache_put(cache_key, asdict(summary))
             return summary
 
         except Exception as e:
@@ -204,66 +493,38 @@ THEMES:
                 themes=["Error occurred during processing"],
             )
 
-    def _parse_summary(self, response_text: str) -> Summary:
-        """Parse Claude's response into a Summary object.
+    def _summary_from_input(self, data: dict) -> Summary:
+        """Build a Summary from emit_summary tool input.
 
         Args:
-            response_text: Raw response from Claude
+            data: Tool input matching the emit_summary schema
 
         Returns:
-            Parsed Summary object
+            Summary object (with placeholders for any empty fields)
         """
-        lines = response_text.strip().split("\n")
-        overview = ""
-        key_points = []
-        themes = []
-
-        section = None
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-
-            if line.startswith("OVERVIEW:"):
-                section = "overview"
-                continue
-            if line.startswith("KEY POINTS:"):
-                section = "key_points"
-                continue
-            if line.startswith("THEMES:"):
-                section = "themes"
-                continue
-
-            if section == "overview":
-                if overview:
-                    overview += "\n" + line  # Preserve line breaks for formatting
-                else:
-                    overview = line
-            elif section == "key_points" and line.startswith("- "):
-                key_points.append(line[2:])
-            elif section == "themes" and line.startswith("- "):
-                themes.append(line[2:])
-
-        # Ensure we have at least some content
-        if not overview:
-            overview = "Summary could not be generated."
-        if not key_points:
-            key_points = ["No key points extracted"]
-        if not themes:
-            themes = ["No themes identified"]
-
-        return Summary(overview=overview, key_points=key_points, themes=themes)
+        return Summary(
+            overview=data.get("overview") or "Summary could not be generated.",
+            key_points=data.get("key_points") or ["No key points extracted"],
+            themes=data.get("themes") or ["No themes identified"],
+        )
+
+
+# Output cap for quote extraction: 3-5 quotes with context fit well
+# under this, and output tokens are the expensive direction
+_QUOTES_MAX_TOKENS = 900
 
 
 class QuoteExtractor:
     """Extract memorable quotes from transcripts using Claude."""
 
-    def __init__(self, api_key: str | None = None, model: str | None = None):
+    def __init__(self, api_key: str | None = None, model: str | None = None, client: "Anthropic | None" = None):
         """Initialize quote extractor.
 
         Args:
             api_key: Anthropic API key. If not provided, reads from ANTHROPIC_API_KEY env var.
-            model: Model to use. If not provided, uses AMPLIFIER_MODEL_DEFAULT or claude-haiku-4-5-20251001.
+            model: Model to use. If not provided, uses AMPLIFIER_MODEL_QUOTES,
+                then AMPLIFIER_MODEL_DEFAULT, then claude-haiku-4-5-20251001.
+            client: Anthropic client to reuse. If not provided, a shared per-key client is used.
         """
         if not ANTHROPIC_AVAILABLE:
             raise ImportError("anthropic package not available. Install with: pip install anthropic")
@@ -273,93 +534,130 @@ class QuoteExtractor:
         if not self.api_key:
             raise ValueError("ANTHROPIC_API_KEY not set. Please set it in your environment or pass it as a parameter.")
 
-        # Get model from param or environment
-        # Default to Claude Haiku 4.5 (Oct 2025) - fastest model with near-frontier intelligence
-        self.model = model or os.getenv("AMPLIFIER_MODEL_DEFAULT", "claude-haiku-4-5-20251001")
+        # Quote selection needs more judgement than summarization - its
+        # model can be raised independently without dragging summaries
+        # (and their long transcripts) onto the pricier model too
+        self.model = model or _model_for_task("AMPLIFIER_MODEL_QUOTES")
 
-        # Initialize Anthropic client
-        self.client = Anthropic(api_key=self.api_key)
+        # Use the injected client or the shared per-key one
+        self.client = client or _get_client(self.api_key)
 
-    def extract(self, transcript, video_url: str | None, video_id: str) -> list[Quote]:
-        """Extract memorable quotes from a transcript.
+    def _build_prompt(self, transcript) -> str:
+        """Build the per-video user content for quote extraction.
+
+        The extraction instructions live in the cacheable ``_QUOTE_SYSTEM``
+        block; only the timestamped transcript varies per call.
 
         Args:
             transcript: Transcript object with segments
+
+        Returns:
+            User message content with timestamped transcript text
+        """
+        # Prepare transcript text with timestamps for better extraction
+        transcript_with_timestamps = self._format_transcript_with_timestamps(transcript)
+
+        # Budget the slice against the context window rather than a
+        # hardcoded character count
+        max_chars = _transcript_char_budget(_QUOTE_SYSTEM, _QUOTES_MAX_TOKENS)
+        return _QUOTE_USER.format(transcript=transcript_with_timestamps[:max_chars])
+
+    def build_batch_request(self, custom_id: str, transcript) -> dict:
+        """Build a Message Batches API request entry for one quote extraction.
+
+        Args:
+            custom_id: Identifier used to match the batch result back
+            transcript: Transcript object with segments
+
+        Returns:
+            Request dict for client.messages.batches.create
+        """
+        return {
+            "custom_id": custom_id,
+            "params": {
+                "model": self.model,
+                "max_tokens": _QUOTES_MAX_TOKENS,
+                "temperature": 0.3,
+                "system": _cached_system(_QUOTE_SYSTEM),
+                "tools": [_QUOTES_TOOL],
+                "tool_choice": {"type": "tool", "name": "emit_quotes"},
+                "messages": [{"role": "user", "content": self._build_prompt(transcript)}],
+            },
+        }
+
+    def _to_quotes(self, quotes_data: list[dict], video_url: str | None, video_id: str) -> list[Quote]:
+        """Convert parsed quote dicts into Quote objects with YouTube links.
+
+        Args:
+            quotes_data: Parsed quote dictionaries from Claude's response
             video_url: Optional YouTube URL for generating timestamp links
             video_id: Video ID for reference
 
         Returns:
             List of Quote objects with timestamps and context
         """
-        # Prepare transcript text with timestamps for better extraction
-        transcript_with_timestamps = self._format_transcript_with_timestamps(transcript)
+        quotes = []
+        for quote_data in quotes_data:
+            timestamp_link = None
+            if video_url and "youtube.com" in video_url:
+                seconds = int(quote_data.get("timestamp", 0))
+                timestamp_link = f"https://youtube.com/watch?v={video_id}&t={seconds}s"
+
+            quotes.append(
+                Quote(
+                    text=quote_data.get("text", ""),
+                    timestamp=quote_data.get("timestamp", 0.0),
+                    timestamp_link=timestamp_link,
+                    context=quote_data.get("context", ""),
+                )
+            )
 
-        prompt = f"""Extract 3-5 memorable, insightful quotes from this transcript.
+        return quotes
 
-Choose quotes that:
-- Capture key ideas or surprising insights
-- Are complete thoughts (not fragments)
-- Would stand alone as meaningful statements
-- Represent different aspects of the content
+    def extract(self, transcript, video_url: str | None, video_id: str) -> list[Quote]:
+        """Extract memorable quotes from a transcript.
 
-For each quote, provide:
-1. The exact quote text
-2. The timestamp (in seconds) when it appears
-3. Context explaining why this quote is significant
+        Args:
+            transcript: Transcript object with segments
+            video_url: Optional YouTube URL for generating timestamp links
+            video_id: Video ID for reference
 
-Transcript:
-{transcript_with_timestamps[:100000]}  # ~25k tokens - well within Haiku 4.5's 200k context
-
-Please respond in JSON format with an array of quotes:
-[
-  {{
-    "text": "The exact quote here",
-    "timestamp": 123.5,
-    "context": "Why this quote matters"
-  }}
-]
-"""
+        Returns:
+            List of Quote objects with timestamps and context
+        """
+        cache_key = _cache_key("quotes", self.model, video_url or "", video_id, transcript.text)
+        cached = _cache_get(cache_key)
+        if isinstance(cached, list):
+            logger.info("Using cached quotes")
+            return [Quote(**q) for q in cached]
 
-        try:
-            response = self.client.messages.create(
+        prompt = self._build_prompt(transcript)
+
+        # Streamed for the same reasons as summary generation
+        def _make_request():
+            with self.client.messages.stream(
                 model=self.model,
-                max_tokens=2000,
+                max_tokens=_QUOTES_MAX_TOKENS,
                 temperature=0.3,  # Lower temperature for accurate extraction
+                system=_cached_system(_QUOTE_SYSTEM),
+                tools=[_QUOTES_TOOL],
+                tool_choice={"type": "tool", "name": "emit_quotes"},
                 messages=[
                     {
                         "role": "user",
                         "content": prompt,
                     }
                 ],
-            )
+            ) as stream:
+                return stream.get_final_message()
 
-            # Parse the response - extract text from the first text block
-            content = ""
-            for block in response.content:
-                if hasattr(block, "text"):
-                    content = block.text  # type: ignore[attr-defined]
-                    break
-            if not content:
-                content = str(response.content[0])
-            quotes_data = self._parse_quotes_response(content)
-
-            # Convert to Quote objects with YouTube links if applicable
-            quotes = []
-            for quote_data in quotes_data:
-                timestamp_link = None
-                if video_url and "youtube.com" in video_url:
-                    seconds = int(quote_data.get("timestamp", 0))
-                    timestamp_link = f"https://youtube.com/watch?v={video_id}&t={seconds}s"
-
-                quotes.append(
-                    Quote(
-                        text=quote_data.get("text", ""),
-                        timestamp=quote_data.get("timestamp", 0.0),
-                        timestamp_link=timestamp_link,
-                        context=quote_data.get("context", ""),
-                    )
-                )
+        try:
+            response = _call_with_retries(_make_request)
+
+            quotes_data = _tool_input(response.content).get("quotes", [])
 
+            quotes = self._to_quotes(quotes_data, video_url, video_id)
+            _cache_put(cache_key, [asdict(q) for q in quotes])
             return quotes
 
         except Exception as e:
@@ -380,57 +678,17 @@ Please respond in JSON format with an array of quotes:
             # If no segments, return plain text
             return transcript.text
 
-        # Format with timestamps every few segments
-        formatted = []
-        for i, segment in enumerate(transcript.segments[:100]):  # Limit segments to avoid token limits
-            if i % 5 == 0:  # Add timestamp every 5 segments
-                minutes = int(segment.start // 60)
-                seconds = int(segment.start % 60)
-                formatted.append(f"\n[{minutes:02d}:{seconds:02d}] ")
-            formatted.append(segment.text + " ")
+        def format_ts(start: float) -> str:
+            minutes, seconds = divmod(int(start), 60)
+            return f"\n[{minutes:02d}:{seconds:02d}] "
 
-        return "".join(formatted)
-
-    def _parse_quotes_response(self, response_text: str) -> list[dict]:
-        """Parse Claude's response to extract quote data.
-
-        Args:
-            response_text: Raw response from Claude
-
-        Returns:
-            List of quote dictionaries
-        """
-        try:
-            # Try to find JSON in the response
-            response_text = response_text.strip()
-
-            # If the response starts with ```json, extract the JSON
-            if response_text.startswith("```json"):
-                response_text = response_text[7:]
-                if response_text.endswith("```"):
-                    response_text = response_text[:-3]
-            elif response_text.startswith("```"):
-                response_text = response_text[3:]
-                if response_text.endswith("```"):
-                    response_text = response_text[:-3]
-
-            # Parse the JSON
-            quotes_data = json.loads(response_text.strip())
-
-            # Ensure it's a list
-            if not isinstance(quotes_data, list):
-                logger.warning("Quote response was not a list")
-                return []
-
-            return quotes_data
-
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse quotes JSON: {e}")
-            logger.debug(f"Response text: {response_text[:500]}")
-            return []
-        except Exception as e:
-            logger.error(f"Error parsing quotes response: {e}")
-            return []
+        # Timestamp every 5 segments - step the range instead of testing
+        # i % 5 on every segment
+        segments = transcript.segments[:100]  # Limit segments to avoid token limits
+        return "".join(
+            format_ts(segments[i].start) + " ".join(s.text for s in segments[i : i + 5]) + " "
+            for i in range(0, len(segments), 5)
+        )
 
 
 def generate_insights(
@@ -505,9 +763,7 @@ def generate_insights(
         )
 
         # Integrate quotes with key points where relevant
-        for point in summary.key_points:
-            lines.append(f"- {point}")
-
+        lines.extend(f"- {point}" for point in summary.key_points)
         lines.append("")
 
     # Add notable quotes section if quotes are available
@@ -551,9 +807,7 @@ def generate_insights(
             ]
         )
 
-        for theme in summary.themes:
-            lines.append(f"- {theme}")
-
+        lines.extend(f"- {theme}" for theme in summary.themes)
         lines.append("")
 
     # Add additional quotes section if there are many quotes
@@ -565,13 +819,14 @@ def generate_insights(
             ]
         )
 
+        # More compact format for additional quotes - pick the final string
+        # up front instead of appending then rewriting lines[-1]
         for quote in quotes[7:]:
             timestamp_str = _format_timestamp(quote.timestamp)
-
-            # More compact format for additional quotes
-            lines.append(f'- "{quote.text}" [{timestamp_str}]')
             if quote.timestamp_link:
-                lines[-1] = f'- "{quote.text}" [[{timestamp_str}]({quote.timestamp_link})]'
+                lines.append(f'- "{quote.text}" [[{timestamp_str}]({quote.timestamp_link})]')
+            else:
+                lines.append(f'- "{quote.text}" [{timestamp_str}]')
 
         lines.append("")
 
@@ -7,12 +7,23 @@ Uses WhisperTranscriber and VideoLoader from tool modules.
 
 # pyright: reportAttributeAccessIssue=false, reportMissingImports=false
 
+import asyncio
+import hashlib
+import inspect
+import json
 import logging
-from collections.abc import Callable
+import os
+import queue
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
+from dataclasses import asdict, dataclass
+from pathlib import Path
 
 from amplifier_module_tool_whisper import WhisperTranscriber  # type: ignore
-from amplifier_module_tool_youtube_dl import AudioExtractor, VideoLoader  # type: ignore
+from amplifier_module_tool_youtube_dl import AudioExtractor, VideoInfo, VideoLoader  # type: ignore
 
+from . import insights
 from .insights import QuoteExtractor, SummaryGenerator
 from .state import StateManager, VideoProcessingResult
 from .storage import TranscriptStorage
@@ -22,6 +33,22 @@ logger = logging.getLogger(__name__)
 # Type alias for progress callback
 ProgressCallback = Callable[[str, dict], None]
 
+# Whisper API upload cap - audio at or above this must be re-encoded
+_API_SIZE_LIMIT = 25 * 1024 * 1024
+
+
+@dataclass(slots=True)
+class _LocalVideoInfo:
+    """VideoInfo stand-in for local files (no download metadata)."""
+
+    id: str
+    title: str
+    source: str
+    duration: float = 0.0  # Determined during transcription
+    uploader: str = "Local File"
+    description: str | None = None
+    type: str = "file"
+
 
 class TranscriptionPipeline:
     """Orchestrates the transcription pipeline using tool core classes."""
@@ -33,6 +60,9 @@ class TranscriptionPipeline:
         force_download: bool = False,
         on_progress: ProgressCallback | None = None,
         question: str | None = None,
+        max_concurrency: int = 4,
+        batch_mode: bool = False,
+        progress_loop: asyncio.AbstractEventLoop | None = None,
     ):
         """Initialize pipeline.
 
@@ -40,8 +70,14 @@ class TranscriptionPipeline:
             state_manager: State manager for persistence (creates new if None)
             enhance: Whether to enable AI enhancements (summaries/quotes)
             force_download: If True, skip cache and re-download audio
-            on_progress: Optional callback for progress updates (stage, data) -> None
+            on_progress: Optional callback for progress updates (stage, data) -> None;
+                may be async - see progress_loop
             question: Optional question to answer in insights overview
+            max_concurrency: Default number of videos processed at once by run_async
+            batch_mode: Defer AI enhancements to one Message Batches call at end of run
+            progress_loop: Event loop that coroutines returned by an async
+                on_progress are dispatched to, fire-and-forget, when the
+                pipeline runs in a worker thread
         """
         # Initialize tool core classes directly
         self.whisper = WhisperTranscriber()
@@ -52,10 +88,35 @@ class TranscriptionPipeline:
         self.force_download = force_download
         self.on_progress = on_progress
         self.question = question
+        self.max_concurrency = max_concurrency
+        self.batch_mode = batch_mode
+        self._progress_loop = progress_loop
+
+        # Enhancement jobs deferred until end of run in batch mode
+        self._pending_enhancements: list[dict] = []
+
+        # Background pool for AI enhancement - the summary/quote API
+        # calls take many seconds and touch none of the next video's
+        # state, so they run off the critical path; the run methods wait
+        # on the outstanding futures before marking the run complete
+        self._enhance_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="enhance")
+        self._enhance_futures: list[Future] = []
 
         # Initialize storage
         self.storage = TranscriptStorage()
 
+        # Guards state saves when videos are processed concurrently
+        self._state_lock = threading.Lock()
+
+        # Output directories already created this run - skips the repeat
+        # mkdir syscall per video (set.add is GIL-atomic; a race costs at
+        # most one extra idempotent mkdir)
+        self._created_dirs: set[Path] = set()
+
+        # Outputs of the most recent successful process_video call, so UIs
+        # can render results without re-reading them from disk
+        self.last_result: dict | None = None
+
         # Initialize AI enhancement components if enabled
         self.summary_generator = None
         self.quote_extractor = None
@@ -68,6 +129,20 @@ class TranscriptionPipeline:
                 logger.warning(f"AI enhancement disabled: {e}")
                 self.enhance = False
 
+    def _ensure_dir(self, path: Path) -> Path:
+        """Create a directory once per run; later calls are set lookups.
+
+        Args:
+            path: Directory to create if not yet seen
+
+        Returns:
+            The same path, for chaining
+        """
+        if path not in self._created_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(path)
+        return path
+
     def _report_progress(self, stage: str, data: dict | None = None) -> None:
         """Report progress to callback if registered.
 
@@ -75,11 +150,106 @@ class TranscriptionPipeline:
             stage: Pipeline stage name
             data: Optional metadata (cost, duration, video_id, etc.)
         """
-        if self.on_progress:
+        # CLI runs have no callback - bail before any further work, and
+        # read the attribute once so the call uses the same object
+        cb = self.on_progress
+        if cb is None:
+            return
+
+        try:
+            result = cb(stage, data if data is not None else {})
+
+            # Async callbacks hand their coroutine to the UI's event loop
+            # fire-and-forget, so a slow render never blocks this thread
+            if inspect.iscoroutine(result):
+                loop = self._progress_loop
+                if loop is not None and loop.is_running():
+                    asyncio.run_coroutine_threadsafe(result, loop)
+                else:
+                    asyncio.run(result)
+        except Exception as e:
+            logger.warning(f"Progress callback failed: {e}")
+
+    def _cached_load(self, url: str):
+        """Load URL metadata, caching it on disk keyed by URL.
+
+        A yt-dlp metadata fetch costs a network round-trip plus process
+        startup per URL. Resumes and retries hit the same URLs again, so
+        results are kept in the session's meta_cache and replayed from a
+        local file read instead.
+
+        Args:
+            url: Video URL
+
+        Returns:
+            VideoInfo from the youtube tool (possibly from cache)
+        """
+        key = hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+        cache_file = self.state.session_dir / "meta_cache" / f"{key}.json"
+
+        if cache_file.exists():
             try:
-                self.on_progress(stage, data or {})
+                return VideoInfo(**json.loads(cache_file.read_text()))
             except Exception as e:
-                logger.warning(f"Progress callback failed: {e}")
+                logger.debug(f"Ignoring unreadable metadata cache for {url}: {e}")
+
+        video_info = self.youtube.load(url)
+
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(".tmp")
+            tmp_file.write_text(json.dumps(asdict(video_info)))
+            os.replace(tmp_file, cache_file)  # Atomic - no torn cache files
+        except Exception as e:
+            logger.debug(f"Could not cache metadata for {url}: {e}")
+
+        return video_info
+
+    def _resolve_video_info(self, source: str, is_url: bool):
+        """Stage 1: resolve metadata for a URL or local file.
+
+        Args:
+            source: URL or file path
+            is_url: Whether source is a remote URL
+
+        Returns:
+            VideoInfo from the youtube tool, or a local-file stand-in
+        """
+        if is_url:
+            return self._cached_load(source)
+
+        local_path = Path(source)
+        return _LocalVideoInfo(id=local_path.stem, title=local_path.name, source=str(local_path))
+
+    def _obtain_audio(self, source: str, is_url: bool, output_dir: Path) -> Path:
+        """Stages 2-3: download or locate audio, then compress for the API.
+
+        Args:
+            source: URL or file path
+            is_url: Whether source is a remote URL
+            output_dir: Directory downloads land in
+
+        Returns:
+            Path to API-ready audio
+        """
+        if is_url:
+            # Download audio using youtube tool
+            audio_path = self.youtube.download_audio(
+                source, output_dir, output_filename="audio.mp3", use_cache=(not self.force_download)
+            )
+        else:
+            # Local file - just use it directly
+            audio_path = Path(source)
+            if not audio_path.exists():
+                raise FileNotFoundError(f"Audio file not found: {source}")
+
+        # An mp3 already under the API cap needs no re-encode - skipping
+        # the ffmpeg pass saves tens of seconds of CPU on the common
+        # path (downloads and cached/resumed runs are audio.mp3)
+        if audio_path.suffix.lower() == ".mp3" and audio_path.stat().st_size < _API_SIZE_LIMIT:
+            return audio_path
+
+        return self.audio_extractor.compress_for_api(audio_path)
 
     def process_video(self, source: str) -> bool:
         """Process a single video/audio source.
@@ -90,6 +260,10 @@ class TranscriptionPipeline:
         Returns:
             True if successful, False otherwise
         """
+        self.last_result = None
+        self.storage.last_markdown = None
+        self.storage.last_insights = None
+
         try:
             # Stage 1: Load video info
             self.state.update_stage("loading", source)
@@ -97,33 +271,11 @@ class TranscriptionPipeline:
 
             # Determine if source is URL or local file
             is_url = source.startswith("http://") or source.startswith("https://")
-
-            if is_url:
-                # Get video metadata
-                video_info = self.youtube.load(source)
-            else:
-                # Local file - create VideoInfo
-                from pathlib import Path
-
-                local_path = Path(source)
-                video_info = type(
-                    "VideoInfo",
-                    (),
-                    {
-                        "id": local_path.stem,
-                        "title": local_path.name,
-                        "source": str(local_path),
-                        "duration": 0.0,  # Will be determined during transcription
-                        "uploader": "Local File",
-                        "description": None,
-                        "type": "file",
-                    },
-                )()
+            video_info = self._resolve_video_info(source, is_url)
 
             # Determine output directory for this video
             video_id = self.storage._sanitize_filename(video_info.id)
-            output_dir = self.storage.output_dir / video_id
-            output_dir.mkdir(parents=True, exist_ok=True)
+            output_dir = self._ensure_dir(self.storage.output_dir / video_id)
 
             # Check for cached transcript (skip expensive transcription)
             transcript = None
@@ -144,23 +296,10 @@ class TranscriptionPipeline:
                     cost = self.whisper.estimate_cost(video_info.duration)
                     logger.info(f"  Estimated cost: ${cost:.3f}")
 
-                # Stage 2: Download/extract audio
+                # Stages 2-3: Download/extract audio, compress if needed
                 self.state.update_stage("extracting", video_info.id)
                 self._report_progress("extracting", {"video_id": video_info.id, "title": video_info.title})
-
-                if is_url:
-                    # Download audio using youtube tool
-                    audio_path = self.youtube.download_audio(
-                        source, output_dir, output_filename="audio.mp3", use_cache=(not self.force_download)
-                    )
-                else:
-                    # Local file - just use it directly or copy
-                    audio_path = Path(source)
-                    if not audio_path.exists():
-                        raise FileNotFoundError(f"Audio file not found: {source}")
-
-                # Stage 3: Compress if needed
-                audio_path = self.audio_extractor.compress_for_api(audio_path)
+                audio_path = self._obtain_audio(source, is_url, output_dir)
 
                 # Stage 4: Transcribe
                 self.state.update_stage("transcribing", video_info.id)
@@ -173,31 +312,27 @@ class TranscriptionPipeline:
                 output_dir = self.storage.save(transcript, video_info, audio_path)
 
             # Stage 6: AI Enhancement (if enabled)
-            if self.enhance and self.summary_generator and self.quote_extractor:
-                try:
-                    self.state.update_stage("enhancing", video_info.id)
-                    self._report_progress("enhancing", {"video_id": video_info.id})
-                    logger.info("Generating AI enhancements...")
-
-                    # Generate summary (with optional question)
-                    summary = self.summary_generator.generate(transcript.text, video_info.title, question=self.question)
-
-                    # Extract quotes
-                    video_url = source if is_url else None
-                    quotes = self.quote_extractor.extract(transcript, video_url, video_info.id)
-
-                    # Save combined insights document
-                    self.storage.save_insights(
-                        summary=summary,
-                        quotes=quotes,
-                        title=video_info.title,
-                        output_dir=output_dir,
-                        question=self.question,
+            if self.enhance and self.summary_generator and self.quote_extractor and self.batch_mode:
+                # Defer to one Message Batches submission at the end of the
+                # run (50% cost for async bulk jobs)
+                self._pending_enhancements.append(
+                    {
+                        "video_id": video_info.id,
+                        "title": video_info.title,
+                        "transcript": transcript,
+                        "video_url": source if is_url else None,
+                        "output_dir": output_dir,
+                    }
+                )
+            elif self.enhance and self.summary_generator and self.quote_extractor:
+                # The transcript is already persisted, so the LLM calls run
+                # on the background pool and the next video starts
+                # immediately; insights arrive asynchronously
+                self._enhance_futures.append(
+                    self._enhance_pool.submit(
+                        self._do_enhance, transcript, video_info, source if is_url else None, output_dir
                     )
-
-                    logger.info("✓ AI enhancements complete")
-                except Exception as e:
-                    logger.warning(f"AI enhancement failed (transcript saved): {e}")
+                )
 
             # Record success
             result = VideoProcessingResult(
@@ -210,6 +345,14 @@ class TranscriptionPipeline:
             )
             self.state.add_processed(result)
 
+            # Keep rendered outputs in memory (None when a cached transcript
+            # skipped the markdown save)
+            self.last_result = {
+                "transcript_md": self.storage.last_markdown,
+                "insights_md": self.storage.last_insights,
+                "output_dir": output_dir,
+            }
+
             return True
 
         except Exception as e:
@@ -226,8 +369,94 @@ class TranscriptionPipeline:
 
             return False
 
-    def run(self, sources: list[str], resume: bool = False) -> bool:
-        """Run the transcription pipeline.
+    def _do_enhance(self, transcript, video_info, video_url: str | None, output_dir: Path) -> None:
+        """Stage 6: generate and save summary + quotes for one video.
+
+        Runs on the background enhancement pool so the next video's
+        download and transcription are not blocked behind these calls.
+
+        Args:
+            transcript: Transcript from the whisper tool
+            video_info: Resolved video metadata
+            video_url: Source URL, or None for local files
+            output_dir: Directory the insights document is saved to
+        """
+        try:
+            self.state.update_stage("enhancing", video_info.id)
+            self._report_progress("enhancing", {"video_id": video_info.id})
+            logger.info("Generating AI enhancements...")
+
+            # Summary and quote extraction are independent Claude
+            # calls - run them concurrently so the stage takes
+            # max(summary, quotes) instead of their sum
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                summary_future = pool.submit(
+                    self.summary_generator.generate,
+                    transcript.text,
+                    video_info.title,
+                    question=self.question,
+                )
+                quotes_future = pool.submit(self.quote_extractor.extract, transcript, video_url, video_info.id)
+                summary = summary_future.result()
+                quotes = quotes_future.result()
+
+            # Save combined insights document
+            self.storage.save_insights(
+                summary=summary,
+                quotes=quotes,
+                title=video_info.title,
+                output_dir=output_dir,
+                question=self.question,
+            )
+
+            logger.info("✓ AI enhancements complete")
+        except Exception as e:
+            logger.warning(f"AI enhancement failed (transcript saved): {e}")
+
+    def _wait_for_enhancements(self) -> None:
+        """Block until outstanding background enhancement jobs finish."""
+        if self._enhance_futures:
+            wait(self._enhance_futures)
+            self._enhance_futures = []
+
+    def _prefetch_audio(self, sources: list[str]) -> None:
+        """Download audio for all URL sources before any transcription starts.
+
+        Downloaded files land in each video's output directory, so the
+        per-video processing loop (and a later ``--resume`` run) picks them
+        up through the download cache instead of re-fetching.
+
+        Args:
+            sources: List of video sources (URLs or files)
+        """
+        urls = [s for s in sources if s.startswith("http://") or s.startswith("https://")]
+        if not urls:
+            return
+
+        self.state.update_stage("prefetching")
+        logger.info(f"Prefetching audio for {len(urls)} videos")
+
+        for source in urls:
+            try:
+                video_info = self._cached_load(source)
+                video_id = self.storage._sanitize_filename(video_info.id)
+                output_dir = self._ensure_dir(self.storage.output_dir / video_id)
+
+                self._report_progress("prefetching", {"video_id": video_info.id, "title": video_info.title})
+                self.youtube.download_audio(
+                    source, output_dir, output_filename="audio.mp3", use_cache=(not self.force_download)
+                )
+            except Exception as e:
+                # Leave the failure to the per-video processing loop so it is
+                # recorded in state like any other download error
+                logger.warning(f"Prefetch failed for {source}: {e}")
+
+    def run_batched(self, sources: list[str], resume: bool = False) -> bool:
+        """Run the pipeline in batch mode: prefetch all audio, then transcribe.
+
+        Separating the download phase from the transcription phase means an
+        interrupted batch can resume without repeating completed downloads,
+        and downloads are not interleaved with long transcription calls.
 
         Args:
             sources: List of video sources (URLs or files)
@@ -236,6 +465,72 @@ class TranscriptionPipeline:
         Returns:
             True if all videos processed successfully
         """
+        if resume:
+            pending = self.state.get_pending_sources() or sources
+        else:
+            pending = sources
+
+        self._prefetch_audio(pending)
+        return self.run(sources, resume=resume)
+
+    def stream(self, source: str) -> Iterator[tuple[str, dict]]:
+        """Process a video in the background and yield progress events live.
+
+        Stage events flow to the caller as they happen, so UIs can render
+        incremental updates instead of blocking on one opaque call. The
+        final event is ``("done", {"success": bool})``.
+
+        Args:
+            source: URL or file path
+
+        Yields:
+            (stage, data) tuples as the pipeline advances
+        """
+        events: queue.Queue[tuple[str, dict]] = queue.Queue()
+        previous_callback = self.on_progress
+
+        def forward(stage: str, data: dict) -> None:
+            if previous_callback:
+                previous_callback(stage, data)
+            events.put((stage, data))
+
+        def target() -> None:
+            success = False
+            try:
+                success = self.process_video(source)
+
+                # Single-video streams report done only once insights are
+                # in, so UIs can render them straight from last_result
+                self._wait_for_enhancements()
+                if self.last_result is not None:
+                    self.last_result["insights_md"] = self.storage.last_insights
+            finally:
+                events.put(("done", {"success": success}))
+
+        self.on_progress = forward
+        thread = threading.Thread(target=target, daemon=True)
+        thread.start()
+
+        try:
+            while True:
+                stage, data = events.get()
+                yield stage, data
+                if stage == "done":
+                    break
+        finally:
+            self.on_progress = previous_callback
+            thread.join()
+
+    def _prepare_sources(self, sources: list[str], resume: bool) -> list[str]:
+        """Seed state with sources and return the list still to process.
+
+        Args:
+            sources: List of video sources (URLs or files)
+            resume: Whether to resume from saved state
+
+        Returns:
+            Sources pending processing (empty if nothing remains)
+        """
         # Store sources in state
         if not resume or not self.state.state.sources:
             self.state.state.sources = sources
@@ -248,29 +543,205 @@ class TranscriptionPipeline:
             pending = self.state.get_pending_sources()
             if not pending:
                 logger.info("No pending videos to process")
-                self.state.mark_complete()
-                return True
+                return []
             logger.info(f"Resuming with {len(pending)} pending videos")
-            sources_to_process = pending
-        else:
-            sources_to_process = sources
+            return pending
 
-        logger.info(f"Processing {len(sources_to_process)} videos")
-        logger.info(f"Output directory: {self.storage.output_dir}")
+        return sources
 
-        # Process each video
-        all_success = True
-        for i, source in enumerate(sources_to_process, 1):
-            logger.info(f"\n[{i}/{len(sources_to_process)}] {source}")
+    def _run_batch_enhancement(self) -> None:
+        """Submit all deferred summary/quote jobs as one Message Batches call.
+
+        Batched requests cost half the real-time price and a multi-video run
+        is already a background job, so the longer turnaround is acceptable.
+        Results are polled with exponential backoff and saved per video.
+        """
+        jobs = self._pending_enhancements
+        if not jobs or not self.summary_generator or not self.quote_extractor:
+            return
 
-            if not self.process_video(source):
-                all_success = False
+        import time
 
-            # Save state after each video
-            self.state.save()
+        self.state.update_stage("enhancing")
+        self._report_progress("enhancing", {"batch_size": len(jobs)})
+        logger.info(f"Submitting batch AI enhancement for {len(jobs)} videos")
+
+        try:
+            # Two requests per video, paired through index-based custom_ids
+            requests = []
+            for i, job in enumerate(jobs):
+                requests.append(
+                    self.summary_generator.build_batch_request(
+                        f"summary-{i}", job["transcript"].text, job["title"], question=self.question
+                    )
+                )
+                requests.append(self.quote_extractor.build_batch_request(f"quotes-{i}", job["transcript"]))
+
+            client = self.summary_generator.client
+            batch = client.messages.batches.create(requests=requests)
+            logger.info(f"Batch {batch.id} submitted ({len(requests)} requests)")
+
+            # Poll with exponential backoff instead of hammering the API
+            delay = 5.0
+            while batch.processing_status != "ended":
+                time.sleep(delay)
+                delay = min(delay * 2, 60.0)
+                batch = client.messages.batches.retrieve(batch.id)
+
+            summaries: dict[int, object] = {}
+            quotes_by_job: dict[int, list] = {}
+            for entry in client.messages.batches.results(batch.id):
+                if entry.result.type != "succeeded":
+                    logger.warning(f"Batch request {entry.custom_id} did not succeed: {entry.result.type}")
+                    continue
+
+                kind, _, index = entry.custom_id.partition("-")
+                i = int(index)
+                try:
+                    tool_input = insights._tool_input(entry.result.message.content)
+                except ValueError as e:
+                    logger.warning(f"Batch request {entry.custom_id} unparseable: {e}")
+                    continue
 
-        # Mark complete
+                if kind == "summary":
+                    summaries[i] = self.summary_generator._summary_from_input(tool_input)
+                else:
+                    job = jobs[i]
+                    quotes_data = tool_input.get("quotes", [])
+                    quotes_by_job[i] = self.quote_extractor._to_quotes(quotes_data, job["video_url"], job["video_id"])
+
+            for i, job in enumerate(jobs):
+                summary = summaries.get(i)
+                quotes = quotes_by_job.get(i)
+                if summary is None and not quotes:
+                    continue
+
+                self.storage.save_insights(
+                    summary=summary,
+                    quotes=quotes or [],
+                    title=job["title"],
+                    output_dir=job["output_dir"],
+                    question=self.question,
+                )
+
+            logger.info("✓ Batch AI enhancements complete")
+        except Exception as e:
+            logger.warning(f"Batch AI enhancement failed (transcripts saved): {e}")
+        finally:
+            self._pending_enhancements = []
+
+    def _finish_run(self) -> None:
+        """Mark the pipeline complete and report final progress."""
+        self._wait_for_enhancements()
+        self._run_batch_enhancement()
         self.state.mark_complete()
         self._report_progress("complete", {"total_processed": len(self.state.state.processed_videos)})
 
+    def run(self, sources: list[str], resume: bool = False) -> bool:
+        """Run the transcription pipeline.
+
+        Multiple sources are processed by a bounded thread pool - each
+        video's stages are dominated by network waits (download, Whisper
+        upload, Claude calls), so overlapping videos gives near-linear
+        speedup up to the API rate limits. Worker count comes from the
+        TRANSCRIBE_PARALLEL env var (default: the pipeline's
+        max_concurrency); set it to 1 to force sequential processing.
+
+        Args:
+            sources: List of video sources (URLs or files)
+            resume: Whether to resume from saved state
+
+        Returns:
+            True if all videos processed successfully
+        """
+        sources_to_process = self._prepare_sources(sources, resume)
+        if not sources_to_process:
+            self._finish_run()
+            return True
+
+        workers = int(os.getenv("TRANSCRIBE_PARALLEL", str(self.max_concurrency)))
+        workers = max(1, min(workers, len(sources_to_process)))
+
+        logger.info(f"Processing {len(sources_to_process)} videos ({workers} workers)")
+        logger.info(f"Output directory: {self.storage.output_dir}")
+
+        all_success = True
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = {pool.submit(self.process_video, source): source for source in sources_to_process}
+                for future in as_completed(futures):
+                    if not future.result():
+                        all_success = False
+
+                    # Snapshot after each video - results are already in the
+                    # WAL, so back-to-back completions may coalesce
+                    self.state.save(debounce=True)
+        else:
+            for i, source in enumerate(sources_to_process, 1):
+                logger.info(f"\n[{i}/{len(sources_to_process)}] {source}")
+
+                if not self.process_video(source):
+                    all_success = False
+
+                # Snapshot after each video - results are already in the
+                # WAL, so back-to-back completions may coalesce
+                self.state.save(debounce=True)
+
+        self._finish_run()
         return all_success
+
+    async def run_async(self, sources: list[str], resume: bool = False, concurrency: int | None = None) -> bool:
+        """Run the pipeline with a bounded pool of concurrent workers.
+
+        Each stage (download, Whisper upload, Claude calls) is IO-bound, so
+        processing several videos concurrently keeps the network busy instead
+        of idling while one video waits on an API round-trip. The bound keeps
+        the pipeline from thrashing API rate limits.
+
+        Args:
+            sources: List of video sources (URLs or files)
+            resume: Whether to resume from saved state
+            concurrency: Maximum number of videos processed at once
+                (default: the pipeline's max_concurrency)
+
+        Returns:
+            True if all videos processed successfully
+        """
+        if concurrency is None:
+            concurrency = self.max_concurrency
+
+        sources_to_process = self._prepare_sources(sources, resume)
+        if not sources_to_process:
+            self._finish_run()
+            return True
+
+        logger.info(f"Processing {len(sources_to_process)} videos ({concurrency} concurrent)")
+        logger.info(f"Output directory: {self.storage.output_dir}")
+
+        queue: asyncio.Queue[str] = asyncio.Queue()
+        for source in sources_to_process:
+            queue.put_nowait(source)
+
+        results: list[bool] = []
+
+        async def worker() -> None:
+            while True:
+                try:
+                    source = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+
+                logger.info(f"Processing: {source}")
+                success = await asyncio.to_thread(self.process_video, source)
+                results.append(success)
+
+                # Snapshot after each video - results are already in the
+                # WAL, so back-to-back completions may coalesce
+                with self._state_lock:
+                    self.state.save(debounce=True)
+
+        worker_count = min(concurrency, len(sources_to_process))
+        await asyncio.gather(*(worker() for _ in range(worker_count)))
+
+        self._finish_run()
+        return all(results)
@@ -6,14 +6,54 @@ Handles pipeline state persistence for resume capability.
 
 import json
 import logging
-from dataclasses import asdict, dataclass, field
+import mmap
+import os
+import threading
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
+# orjson parses/serializes several times faster than the stdlib - the
+# state file and WAL are written constantly during a run; optional
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _dumps_compact(data) -> bytes:
+        return orjson.dumps(data)
+
+    def _dumps_state(state) -> bytes:
+        # orjson walks dataclass trees natively in C - the to_dict
+        # conversion pass disappears entirely
+        return orjson.dumps(state, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+
+    def _json_loads(data):
+        if isinstance(data, memoryview):
+            data = data.tobytes()
+        return json.loads(data)
+
+    def _dumps_compact(data) -> bytes:
+        return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+    def _dumps_state(state) -> bytes:
+        return json.dumps(state.to_dict(), indent=2, ensure_ascii=False).encode("utf-8")
+
+
 logger = logging.getLogger(__name__)
 
+# Minimum seconds between debounced snapshot writes (per-video saves)
+_SAVE_INTERVAL = 1.0
 
-@dataclass
+# Seconds between full snapshots when mutations flow through the WAL
+_SNAPSHOT_INTERVAL = 60.0
+
+
+@dataclass(slots=True)
 class VideoProcessingResult:
     """Result of processing a single video."""
 
@@ -26,8 +66,12 @@ class VideoProcessingResult:
     cost_estimate: float = 0.0
     processed_at: str = field(default_factory=lambda: datetime.now().isoformat())
 
+    def to_dict(self) -> dict:
+        """Serialize without the recursive deep-copy of dataclasses.asdict."""
+        return {slot: getattr(self, slot) for slot in self.__slots__}
+
 
-@dataclass
+@dataclass(slots=True)
 class PipelineState:
     """Complete pipeline state for persistence."""
 
@@ -52,6 +96,19 @@ class PipelineState:
     created_at: str = field(default_factory=lambda: datetime.now().isoformat())
     updated_at: str = field(default_factory=lambda: datetime.now().isoformat())
 
+    def to_dict(self) -> dict:
+        """Serialize for JSON without dataclasses.asdict.
+
+        asdict deep-copies every field of every nested result on every
+        snapshot - pure-Python recursion that grows with the number of
+        processed videos. The fields are flat strings and floats, so a
+        shallow copy per object is equivalent and far cheaper.
+        """
+        data = {slot: getattr(self, slot) for slot in self.__slots__}
+        data["processed_videos"] = [v.to_dict() for v in self.processed_videos]
+        data["failed_videos"] = [v.to_dict() for v in self.failed_videos]
+        return data
+
 
 class StateManager:
     """Manages pipeline state with automatic persistence."""
@@ -70,14 +127,42 @@ class StateManager:
         self.session_dir = Path(session_dir).expanduser()
         self.session_dir.mkdir(parents=True, exist_ok=True)
         self.state_file = self.session_dir / "state.json"
+
+        # Append-only write-ahead log: mutations add one compact JSON
+        # line instead of re-serializing the whole state tree, and
+        # save() becomes a periodic snapshot that truncates the log.
+        # Opened lazily on the first mutation.
+        self.wal_file = self.session_dir / "state.wal"
+        self._wal = None
+
+        # Serializes mutations + writes when videos are processed by
+        # concurrent workers (reentrant: update_stage calls save)
+        self._lock = threading.RLock()
+        self._last_save = time.monotonic()
+
         self.state = self._load_state()
 
+        # Membership indexes kept in step with the result lists, so
+        # resume checks are O(1) instead of rescanning per source
+        self._processed_ids: set[str] = {r.video_id for r in self.state.processed_videos}
+        self._finished_sources: set[str] = {r.source for r in self.state.processed_videos}
+        self._finished_sources.update(r.source for r in self.state.failed_videos)
+
     def _load_state(self) -> PipelineState:
         """Load state from file or create new."""
         if self.state_file.exists():
             try:
-                with open(self.state_file, encoding="utf-8") as f:
-                    data = json.load(f)
+                # Map the snapshot rather than reading it into a bytes
+                # copy first - the parser consumes the file pages in
+                # place, so peak memory stays ~1x file size on big
+                # resumes. (An empty/corrupt file fails into the fresh
+                # -state fallback below, as before.)
+                with open(self.state_file, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    view = memoryview(mm)
+                    try:
+                        data = _json_loads(view)
+                    finally:
+                        view.release()
                 logger.info(f"Resumed state from: {self.state_file}")
                 logger.info(f"  Stage: {data.get('stage', 'unknown')}")
                 logger.info(f"  Processed: {len(data.get('processed_videos', []))}")
@@ -91,64 +176,207 @@ class StateManager:
                 state.failed_videos = [
                     VideoProcessingResult(**v) if isinstance(v, dict) else v for v in state.failed_videos
                 ]
-                return state
+                return self._replay_wal(state)
             except Exception as e:
                 logger.warning(f"Could not load state: {e}")
                 logger.info("Starting fresh pipeline")
 
-        return PipelineState()
+        return self._replay_wal(PipelineState())
+
+    def _replay_wal(self, state: PipelineState) -> PipelineState:
+        """Apply WAL entries written since the last snapshot.
+
+        Args:
+            state: Snapshot state to replay onto
+
+        Returns:
+            State with logged mutations applied
+        """
+        if not self.wal_file.exists():
+            return state
 
-    def save(self) -> None:
-        """Save current state to file."""
-        self.state.updated_at = datetime.now().isoformat()
+        # A crash between snapshot and truncation can leave already
+        # snapshotted results in the log - skip those on replay
+        seen_ids = {r.video_id for r in state.processed_videos}
+        seen_ids.update(r.video_id for r in state.failed_videos)
 
+        applied = 0
         try:
-            state_dict = asdict(self.state)
-            with open(self.state_file, "w", encoding="utf-8") as f:
-                json.dump(state_dict, f, indent=2, ensure_ascii=False)
-            logger.debug(f"State saved to: {self.state_file}")
+            with open(self.wal_file, "rb") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    entry = _json_loads(line)
+                    op, data = entry["op"], entry["data"]
+
+                    if op == "stage":
+                        state.stage = data["stage"]
+                        state.current_video = data.get("current_video")
+                    elif op == "processed" and data["video_id"] not in seen_ids:
+                        result = VideoProcessingResult(**data)
+                        state.processed_videos.append(result)
+                        state.total_duration_seconds += result.duration_seconds
+                        state.total_cost_estimate += result.cost_estimate
+                        seen_ids.add(result.video_id)
+                    elif op == "failed" and data["video_id"] not in seen_ids:
+                        state.failed_videos.append(VideoProcessingResult(**data))
+                        seen_ids.add(data["video_id"])
+                    applied += 1
         except Exception as e:
-            logger.error(f"Failed to save state: {e}")
+            logger.warning(f"Could not fully replay state WAL: {e}")
+
+        if applied:
+            logger.info(f"Replayed {applied} state WAL entries")
+        return state
+
+    def _append_wal(self, op: str, data: dict) -> None:
+        """Log one mutation to the WAL; snapshot if one is overdue.
+
+        Falls back to a full snapshot if the log cannot be written.
+        """
+        with self._lock:
+            try:
+                if self._wal is None:
+                    self._wal = open(self.wal_file, "ab", buffering=0)
+                self._wal.write(_dumps_compact({"op": op, "data": data}) + b"\n")
+
+                # Kick off asynchronous writeback (Linux) without waiting
+                # on a disk barrier; the full fdatasync happens once, at
+                # completion, instead of per mutation
+                if hasattr(os, "sync_file_range"):
+                    try:
+                        os.sync_file_range(self._wal.fileno(), 0, 0, os.SYNC_FILE_RANGE_WRITE)
+                    except OSError:
+                        pass
+            except Exception as e:
+                logger.error(f"Failed to append state WAL: {e}")
+                self.save()
+                return
+
+            if time.monotonic() - self._last_save > _SNAPSHOT_INTERVAL:
+                self.save()
+
+    def save(self, debounce: bool = False, durable: bool = False) -> None:
+        """Save current state to file.
+
+        Routine saves hand the bytes to the page cache and return - the
+        WAL plus the snapshot cadence already bound what a crash can
+        lose, so forcing a disk barrier dozens of times per video buys
+        nothing. Completion requests one explicit fdatasync instead.
+
+        Args:
+            debounce: Skip the write if one happened within the last
+                second. Used for the per-video saves in the pipeline,
+                where concurrent workers can finish in bursts; skipped
+                snapshots lose nothing since results are already in
+                the WAL.
+            durable: Force the snapshot to stable storage before
+                returning. Used once, when the run completes.
+        """
+        with self._lock:
+            if debounce and time.monotonic() - self._last_save < _SAVE_INTERVAL:
+                return
+
+            self.state.updated_at = datetime.now().isoformat()
+
+            try:
+                # Write-then-rename: a crash mid-write leaves the old
+                # snapshot intact instead of a truncated state.json
+                tmp_file = self.state_file.with_suffix(".json.tmp")
+                with open(tmp_file, "wb") as f:
+                    f.write(_dumps_state(self.state))
+                    if durable:
+                        f.flush()
+                        os.fdatasync(f.fileno())
+                os.replace(tmp_file, self.state_file)
+                self._last_save = time.monotonic()
+                logger.debug(f"State saved to: {self.state_file}")
+            except Exception as e:
+                logger.error(f"Failed to save state: {e}")
+                return
+
+            # The snapshot contains everything, so the log restarts empty
+            try:
+                if self._wal is not None:
+                    self._wal.truncate(0)
+                elif self.wal_file.exists():
+                    self.wal_file.unlink()
+            except OSError as e:
+                logger.warning(f"Could not truncate state WAL: {e}")
+
+    def close(self) -> None:
+        """Release the cached WAL file handle.
+
+        Safe to call repeatedly; a later mutation simply reopens the
+        log in append mode.
+        """
+        with self._lock:
+            if self._wal is not None:
+                try:
+                    self._wal.close()
+                except OSError as e:
+                    logger.warning(f"Could not close state WAL: {e}")
+                self._wal = None
+
+    def __enter__(self) -> "StateManager":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def update_stage(self, stage: str, current_video: str | None = None) -> None:
         """Update pipeline stage."""
-        old_stage = self.state.stage
-        self.state.stage = stage
-        self.state.current_video = current_video
+        with self._lock:
+            old_stage = self.state.stage
+            self.state.stage = stage
+            self.state.current_video = current_video
+
+            # Completion gets a full snapshot; routine stage changes are
+            # one appended WAL line instead of a whole-state rewrite
+            if stage == "complete":
+                self.save(durable=True)
+            else:
+                self._append_wal("stage", {"stage": stage, "current_video": current_video})
 
         if current_video:
             logger.info(f"Stage: {old_stage} → {stage} (processing: {current_video})")
         else:
             logger.info(f"Stage: {old_stage} → {stage}")
 
-        self.save()
-
     def add_processed(self, result: VideoProcessingResult) -> None:
         """Add successfully processed video."""
-        self.state.processed_videos.append(result)
-        self.state.total_duration_seconds += result.duration_seconds
-        self.state.total_cost_estimate += result.cost_estimate
-        self.save()
+        with self._lock:
+            self.state.processed_videos.append(result)
+            self._processed_ids.add(result.video_id)
+            self._finished_sources.add(result.source)
+            self.state.total_duration_seconds += result.duration_seconds
+            self.state.total_cost_estimate += result.cost_estimate
+            self._append_wal("processed", result.to_dict())
 
         logger.info(f"✓ Processed {len(self.state.processed_videos)}/{self.state.total_videos}: {result.video_id}")
 
     def add_failed(self, result: VideoProcessingResult) -> None:
         """Add failed video."""
-        self.state.failed_videos.append(result)
-        self.save()
+        with self._lock:
+            self.state.failed_videos.append(result)
+            self._finished_sources.add(result.source)
+            self._append_wal("failed", result.to_dict())
 
         logger.warning(f"✗ Failed: {result.video_id} - {result.error}")
 
     def is_already_processed(self, video_id: str) -> bool:
         """Check if video was already processed."""
-        return any(result.video_id == video_id for result in self.state.processed_videos)
+        return video_id in self._processed_ids
 
     def get_pending_sources(self) -> list[str]:
-        """Get list of sources not yet processed."""
-        processed_sources = {r.source for r in self.state.processed_videos}
-        processed_sources.update({r.source for r in self.state.failed_videos})
+        """Get list of sources not yet processed.
 
-        return [s for s in self.state.sources if s not in processed_sources]
+        Order is preserved so resumes are deterministic; dict.fromkeys
+        drops repeated sources (same URL passed twice) in one C pass.
+        """
+        finished = self._finished_sources
+        return [s for s in dict.fromkeys(self.state.sources) if s not in finished]
 
     def is_complete(self) -> bool:
         """Check if pipeline is complete."""
@@ -173,6 +401,9 @@ class StateManager:
 
     def reset(self) -> None:
         """Reset state for fresh run."""
-        self.state = PipelineState()
-        self.save()
+        with self._lock:
+            self.state = PipelineState()
+            self._processed_ids = set()
+            self._finished_sources = set()
+            self.save()
         logger.info("State reset for fresh pipeline run")
@@ -4,17 +4,97 @@ Storage Core Implementation
 Saves transcripts in multiple formats to organized directories.
 """
 
+import functools
 import json
 import logging
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 from .formatter import format_transcript
 from .insights import generate_insights
 
+# orjson serializes JSON several times faster than the stdlib and emits
+# bytes directly; worthwhile on long transcripts but strictly optional
+try:
+    import orjson
+
+    def _json_dumps(data) -> bytes:
+        return orjson.dumps(data)
+
+except ImportError:
+
+    def _json_dumps(data) -> bytes:
+        return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
 logger = logging.getLogger(__name__)
 
 
+def _copy_range(src_fd: int, dst_fd: int, size: int) -> None:
+    """Copy file contents via copy_file_range (reflink where supported)."""
+    remaining = size
+    while remaining > 0:
+        copied = os.copy_file_range(src_fd, dst_fd, remaining)
+        if copied == 0:
+            raise OSError("copy_file_range made no progress")
+        remaining -= copied
+
+
+def _copy_sendfile(src_fd: int, dst_fd: int, size: int) -> None:
+    """Copy file contents via sendfile (in-kernel, page-cache to page-cache)."""
+    offset = 0
+    while offset < size:
+        sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+        if sent == 0:
+            raise OSError("sendfile made no progress")
+        offset += sent
+
+
+def _copy_file(src: Path, dst: Path) -> None:
+    """Copy src to dst, keeping the data in the kernel where possible.
+
+    copy_file_range lets CoW filesystems (btrfs, xfs, overlayfs) reflink
+    the audio without moving any data; sendfile at least avoids pumping
+    tens of MB through user-space buffers. Filesystems that refuse
+    either fall back to a plain buffered copy. Metadata is preserved to
+    match the shutil.copy2 this replaces.
+    """
+    size = src.stat().st_size
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        try:
+            _copy_range(fsrc.fileno(), fdst.fileno(), size)
+        except (OSError, AttributeError):
+            fdst.seek(0)
+            fdst.truncate()
+            try:
+                _copy_sendfile(fsrc.fileno(), fdst.fileno(), size)
+            except (OSError, AttributeError):
+                fdst.seek(0)
+                fdst.truncate()
+                fsrc.seek(0)
+                shutil.copyfileobj(fsrc, fdst, 1 << 20)
+
+    shutil.copystat(src, dst)
+
+
+# Maps filesystem-invalid characters to underscores in one str.translate
+# pass instead of one str.replace scan per character
+_SANITIZE_TABLE = str.maketrans({char: "_" for char in '<>:"/\\|?*'})
+
+
+@functools.lru_cache(maxsize=1024)
+def _sanitize_filename(name: str) -> str:
+    """Sanitize filename for filesystem.
+
+    Memoized - each video id is sanitized several times per run (output
+    dir, cache check, transcript load), so repeats hit the cache.
+    """
+    return name.translate(_SANITIZE_TABLE)[:100]
+
+
 class TranscriptStorage:
     """Save transcripts in multiple formats."""
 
@@ -31,6 +111,11 @@ class TranscriptStorage:
 
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        # Rendered content from the most recent save, so callers that just
+        # produced a transcript don't have to read it back from disk
+        self.last_markdown: str | None = None
+        self.last_insights: str | None = None
+
     def save(
         self,
         transcript,
@@ -62,10 +147,24 @@ class TranscriptStorage:
 
         logger.info(f"Saving to: {video_dir}")
 
-        # Save audio file if provided
+        # Save audio file if provided. The audio copy is by far the
+        # largest write, so it runs in the background while the small
+        # text formats are written; metadata (size) is read from the
+        # source file, which the copy preserves byte-for-byte. A future
+        # (not a bare thread) carries the copy so failures - disk full,
+        # permissions - re-raise here and the video is marked failed
+        # instead of recorded as success with a broken audio.mp3.
         saved_audio_path = None
+        copy_future = None
+        copy_pool = None
         if audio_path and audio_path.exists():
-            saved_audio_path = self.save_audio(audio_path, video_dir)
+            target_path = video_dir / "audio.mp3"
+            if audio_path.absolute() == target_path.absolute():
+                saved_audio_path = target_path
+            else:
+                copy_pool = ThreadPoolExecutor(max_workers=1)
+                copy_future = copy_pool.submit(self.save_audio, audio_path, video_dir)
+                saved_audio_path = audio_path
 
         # Save in requested formats
         saved_files = []
@@ -86,6 +185,12 @@ class TranscriptStorage:
             srt_path = self._save_srt(transcript, video_dir)
             saved_files.append(f"SRT: {srt_path.name}")
 
+        if copy_future is not None:
+            try:
+                copy_future.result()  # Re-raises any copy error
+            finally:
+                copy_pool.shutdown(wait=False)
+
         logger.info(f"Saved {len(saved_files)} files: {', '.join(saved_files)}")
         return video_dir
 
@@ -99,8 +204,6 @@ class TranscriptStorage:
         Returns:
             Path to saved audio file
         """
-        import shutil
-
         target_path = output_dir / "audio.mp3"
 
         # Don't copy if already in place
@@ -108,7 +211,7 @@ class TranscriptStorage:
             return target_path
 
         # Copy audio file
-        shutil.copy2(audio_path, target_path)
+        _copy_file(audio_path, target_path)
         logger.info(f"Saved audio to: {target_path}")
 
         return target_path
@@ -146,6 +249,7 @@ class TranscriptStorage:
         with open(insights_path, "w", encoding="utf-8") as f:
             f.write(insights_content)
 
+        self.last_insights = insights_content
         logger.info(f"Saved insights to: {insights_path}")
         return insights_path
 
@@ -202,12 +306,7 @@ class TranscriptStorage:
 
     def _sanitize_filename(self, name: str) -> str:
         """Sanitize filename for filesystem."""
-        # Remove invalid characters
-        invalid_chars = '<>:"/\\|?*'
-        for char in invalid_chars:
-            name = name.replace(char, "_")
-        # Limit length
-        return name[:100]
+        return _sanitize_filename(name)
 
     def _save_json(
         self,
@@ -216,50 +315,55 @@ class TranscriptStorage:
         output_dir: Path,
         audio_path: Path | None = None,
     ) -> Path:
-        """Save transcript as JSON with metadata."""
+        """Save transcript as JSON with metadata.
+
+        Segments stream to the file one at a time rather than being
+        materialized as a second full copy of the transcript in a nested
+        dict - peak memory stays flat regardless of transcript length.
+        """
         json_path = output_dir / "transcript.json"
 
         # Add audio metadata if audio file exists
         audio_metadata = None
         if audio_path and audio_path.exists():
             audio_metadata = {
-                "filename": audio_path.name,
+                "filename": "audio.mp3",  # The saved copy is always audio.mp3
                 "size_mb": round(audio_path.stat().st_size / (1024 * 1024), 2),
                 "format": "mp3",
             }
 
-        data = {
-            "video": {
-                "source": video_info.source,
-                "title": video_info.title,
-                "id": video_info.id,
-                "duration": video_info.duration,
-                "uploader": video_info.uploader,
-                "description": video_info.description,
-            },
-            "transcript": {
-                "text": transcript.text,
-                "language": transcript.language,
-                "duration": transcript.duration,
-                "segments": [
-                    {
-                        "id": seg.id,
-                        "start": seg.start,
-                        "end": seg.end,
-                        "text": seg.text,
-                    }
-                    for seg in transcript.segments
-                ],
-            },
-            "audio": audio_metadata,
-            "metadata": {
-                "transcribed_at": datetime.now().isoformat(),
-                "version": "1.0",
-            },
+        video_block = {
+            "source": video_info.source,
+            "title": video_info.title,
+            "id": video_info.id,
+            "duration": video_info.duration,
+            "uploader": video_info.uploader,
+            "description": video_info.description,
+        }
+        metadata_block = {
+            "transcribed_at": datetime.now().isoformat(),
+            "version": "1.0",
         }
 
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        with open(json_path, "wb", buffering=1 << 20) as f:
+            f.write(b'{"video":')
+            f.write(_json_dumps(video_block))
+            f.write(b',"transcript":{"text":')
+            f.write(_json_dumps(transcript.text))
+            f.write(b',"language":')
+            f.write(_json_dumps(transcript.language))
+            f.write(b',"duration":')
+            f.write(_json_dumps(transcript.duration))
+            f.write(b',"segments":[')
+            for i, seg in enumerate(transcript.segments):
+                if i:
+                    f.write(b",")
+                f.write(_json_dumps({"id": seg.id, "start": seg.start, "end": seg.end, "text": seg.text}))
+            f.write(b']},"audio":')
+            f.write(_json_dumps(audio_metadata))
+            f.write(b',"metadata":')
+            f.write(_json_dumps(metadata_block))
+            f.write(b"}")
 
         return json_path
 
@@ -277,6 +381,7 @@ class TranscriptStorage:
         with open(md_path, "w", encoding="utf-8") as f:
             f.write(formatted_content)
 
+        self.last_markdown = formatted_content
         return md_path
 
     def _save_vtt(self, transcript, output_dir: Path) -> Path:
@@ -292,8 +397,9 @@ class TranscriptStorage:
             lines.append(seg.text.strip())
             lines.append("")
 
-        with open(vtt_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines))
+        # Encode once and write in a single call
+        with open(vtt_path, "wb") as f:
+            f.write("\n".join(lines).encode("utf-8"))
 
         return vtt_path
 
@@ -311,22 +417,23 @@ class TranscriptStorage:
             lines.append(seg.text.strip())
             lines.append("")
 
-        with open(srt_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines))
+        # Encode once and write in a single call
+        with open(srt_path, "wb") as f:
+            f.write("\n".join(lines).encode("utf-8"))
 
         return srt_path
 
     def _seconds_to_vtt(self, seconds: float) -> str:
         """Convert seconds to WebVTT timestamp (HH:MM:SS.mmm)."""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = seconds % 60
-        return f"{hours:02d}:{minutes:02d}:{secs:06.3f}"
+        # One float->int conversion, then pure integer divmod chains
+        secs, millis = divmod(round(seconds * 1000), 1000)
+        minutes, secs = divmod(secs, 60)
+        hours, minutes = divmod(minutes, 60)
+        return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}"
 
     def _seconds_to_srt(self, seconds: float) -> str:
         """Convert seconds to SRT timestamp (HH:MM:SS,mmm)."""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        millis = int((seconds % 1) * 1000)
+        secs, millis = divmod(round(seconds * 1000), 1000)
+        minutes, secs = divmod(secs, 60)
+        hours, minutes = divmod(minutes, 60)
         return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
@@ -1,14 +1,16 @@
 """
 Web UI Launcher
 
-Spawns Streamlit server for browser-based interface.
+Runs the Streamlit server in-process for the browser-based interface.
 """
 
 import os
-import subprocess
-import sys
 from pathlib import Path
 
+# Resolved once at import - stable across os.chdir and spares the
+# launcher a stat + Path allocations per call
+_APP_FILE = Path(__file__).resolve().parent / "_web_app.py"
+
 
 def _setup_streamlit_config() -> None:
     """Create Streamlit credentials file to skip email prompt."""
@@ -22,7 +24,7 @@ def _setup_streamlit_config() -> None:
 
 def launch_web_ui(verbose: bool = False) -> None:
     """
-    Launch Streamlit web interface in subprocess.
+    Launch Streamlit web interface in this process.
 
     Opens browser automatically to Streamlit UI.
     Blocks until user kills server (Ctrl+C).
@@ -34,27 +36,28 @@ def launch_web_ui(verbose: bool = False) -> None:
         RuntimeError: If Streamlit not installed or app file missing
     """
     # Get path to Streamlit app file
-    app_file = Path(__file__).parent / "_web_app.py"
+    app_file = _APP_FILE
 
     if not app_file.exists():
         raise RuntimeError(f"Streamlit app file not found: {app_file}")
 
-    # Verify streamlit is available
-    try:
-        import streamlit  # type: ignore  # noqa: F401
-    except ImportError as e:
-        raise RuntimeError("Streamlit not installed. Install with: uv sync") from e
+    # Verify streamlit is installed without executing its import tree -
+    # find_spec only walks the finder chain, so the heavy import happens
+    # once, inside bootstrap below
+    import importlib.util
+
+    if importlib.util.find_spec("streamlit") is None:
+        raise RuntimeError("Streamlit not installed. Install with: uv sync")
 
     # Setup credentials to skip email prompt
     _setup_streamlit_config()
 
-    # Set environment variables to disable telemetry
-    env = os.environ.copy()
-    env["STREAMLIT_BROWSER_GATHER_USAGE_STATS"] = "false"
-
-    # Pass verbose flag to Streamlit app via environment
+    # The server runs on this interpreter, so configure it through our
+    # own environment: disable telemetry and pass the verbose flag on
+    # to the Streamlit app
+    os.environ["STREAMLIT_BROWSER_GATHER_USAGE_STATS"] = "false"
     if verbose:
-        env["AMPLIFIER_VERBOSE"] = "1"
+        os.environ["AMPLIFIER_VERBOSE"] = "1"
 
     # Print startup message
     print("\n🎯 Starting Amplifier Transcribe web interface...")
@@ -65,22 +68,14 @@ def launch_web_ui(verbose: bool = False) -> None:
     else:
         print()
 
-    # Build Streamlit command
-    streamlit_cmd = [
-        sys.executable,
-        "-m",
-        "streamlit",
-        "run",
-        str(app_file),
-    ]
+    # Start the Tornado server via Streamlit's bootstrap API instead of
+    # spawning a second interpreter - the child would pay full startup
+    # cost re-importing Streamlit's tree, which is already loaded here
+    from streamlit.web import bootstrap  # type: ignore
 
+    bootstrap.load_config_options(flag_options={})
     try:
-        # Launch Streamlit server (browser opens automatically)
-        subprocess.run(
-            streamlit_cmd,
-            check=False,  # Don't raise on Ctrl+C
-            env=env,
-        )
+        bootstrap.run(str(app_file), is_hello=False, args=[], flag_options={})
     except KeyboardInterrupt:
         print("\n\n✅ Server stopped. Thanks for using Amplifier Transcribe!")
     finally:
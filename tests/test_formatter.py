@@ -44,6 +44,12 @@ def test_add_paragraph_breaks():
     text = " ".join(sentences)
     result = _add_paragraph_breaks(text)
     assert "\n\n" in result
+    # The trailing paragraph must appear exactly once
+    assert result.count("This is sentence 9.") == 1
+
+    # Punctuation-free ASR output passes through unchanged (and quickly)
+    blob = "word " * 20000
+    assert _add_paragraph_breaks(blob) == blob
 
 
 def test_build_continuous_text_with_timestamps():
@@ -0,0 +1,92 @@
+"""Tests for the pipeline driver."""
+
+from types import SimpleNamespace
+
+from amplifier_app_transcribe.pipeline import TranscriptionPipeline
+from amplifier_app_transcribe.state import StateManager, VideoProcessingResult
+
+
+def test_run_processes_all_sources_concurrently(mocker, tmp_path, monkeypatch):
+    """run() should fan out over workers and record every source."""
+    monkeypatch.setenv("TRANSCRIBE_PARALLEL", "4")
+
+    pipeline = TranscriptionPipeline(state_manager=StateManager(tmp_path / "session"), enhance=False)
+
+    def fake_process(source):
+        pipeline.state.add_processed(VideoProcessingResult(video_id=source, source=source, status="success"))
+        return True
+
+    mocker.patch.object(pipeline, "process_video", side_effect=fake_process)
+
+    assert pipeline.run(["vid1", "vid2", "vid3", "vid4"]) is True
+
+    processed = {r.video_id for r in pipeline.state.state.processed_videos}
+    assert processed == {"vid1", "vid2", "vid3", "vid4"}
+    assert pipeline.state.is_complete()
+
+
+def test_run_batch_enhancement_pairs_results_by_custom_id(mocker, tmp_path):
+    """Batch results should fan back to their videos through custom_ids."""
+    pipeline = TranscriptionPipeline(
+        state_manager=StateManager(tmp_path / "session"), enhance=False, batch_mode=True
+    )
+    pipeline._pending_enhancements = [
+        {
+            "video_id": "vid1",
+            "title": "First",
+            "transcript": SimpleNamespace(text="first transcript"),
+            "video_url": "https://youtube.com/watch?v=vid1",
+            "output_dir": tmp_path / "vid1",
+        },
+        {
+            "video_id": "vid2",
+            "title": "Second",
+            "transcript": SimpleNamespace(text="second transcript"),
+            "video_url": None,
+            "output_dir": tmp_path / "vid2",
+        },
+    ]
+
+    summary_generator = mocker.Mock()
+    summary_generator.build_batch_request.side_effect = lambda custom_id, *a, **k: {"custom_id": custom_id}
+    summary_generator._summary_from_input.side_effect = lambda data: data["overview"]
+    quote_extractor = mocker.Mock()
+    quote_extractor.build_batch_request.side_effect = lambda custom_id, *a, **k: {"custom_id": custom_id}
+    quote_extractor._to_quotes.side_effect = lambda quotes_data, video_url, video_id: [
+        (video_id, q["text"]) for q in quotes_data
+    ]
+    pipeline.enhance = True
+    pipeline.summary_generator = summary_generator
+    pipeline.quote_extractor = quote_extractor
+
+    def entry(custom_id, data, result_type="succeeded"):
+        content = [SimpleNamespace(type="tool_use", input=data)]
+        return SimpleNamespace(
+            custom_id=custom_id,
+            result=SimpleNamespace(type=result_type, message=SimpleNamespace(content=content)),
+        )
+
+    client = summary_generator.client
+    client.messages.batches.create.return_value = SimpleNamespace(id="batch_1", processing_status="ended")
+    # Results arrive out of submission order, and the quotes request for
+    # the second video errored
+    client.messages.batches.results.return_value = [
+        entry("quotes-0", {"quotes": [{"text": "q1"}]}),
+        entry("summary-1", {"overview": "second summary"}),
+        entry("summary-0", {"overview": "first summary"}),
+        entry("quotes-1", {}, result_type="errored"),
+    ]
+    save_insights = mocker.patch.object(pipeline.storage, "save_insights")
+
+    pipeline._run_batch_enhancement()
+
+    requests = client.messages.batches.create.call_args.kwargs["requests"]
+    assert [r["custom_id"] for r in requests] == ["summary-0", "quotes-0", "summary-1", "quotes-1"]
+
+    saved = {call.kwargs["title"]: call.kwargs for call in save_insights.call_args_list}
+    assert saved["First"]["summary"] == "first summary"
+    assert saved["First"]["quotes"] == [("vid1", "q1")]
+    assert saved["First"]["output_dir"] == tmp_path / "vid1"
+    assert saved["Second"]["summary"] == "second summary"
+    assert saved["Second"]["quotes"] == []
+    assert pipeline._pending_enhancements == []
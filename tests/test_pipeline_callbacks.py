@@ -1,13 +1,19 @@
-"""Tests for pipeline progress callback functionality."""
+"""Tests for pipeline progress callback functionality.
 
-from unittest.mock import Mock
+Callbacks are recorded with plain lists rather than Mock - Mock.__call__
+does real bookkeeping per call, which skews any loop that hammers
+_report_progress.
+"""
 
 from amplifier_app_transcribe.pipeline import TranscriptionPipeline
 
 
 def test_pipeline_accepts_callback():
     """Pipeline should accept on_progress callback parameter."""
-    callback = Mock()
+
+    def callback(stage, data):
+        pass
+
     pipeline = TranscriptionPipeline(on_progress=callback)
     assert pipeline.on_progress == callback
 
@@ -21,14 +27,14 @@ def test_pipeline_without_callback_still_works():
 
 def test_report_progress_calls_callback():
     """_report_progress should invoke callback with stage and data."""
-    callback = Mock()
-    pipeline = TranscriptionPipeline(on_progress=callback)
+    calls = []
+    pipeline = TranscriptionPipeline(on_progress=lambda stage, data: calls.append((stage, data)))
 
     # Call _report_progress
     pipeline._report_progress("loading", {"source": "test.mp4"})
 
     # Verify callback was called
-    callback.assert_called_once_with("loading", {"source": "test.mp4"})
+    assert calls == [("loading", {"source": "test.mp4"})]
 
 
 def test_report_progress_without_callback_does_not_crash():
@@ -51,13 +57,28 @@ def test_report_progress_handles_callback_exceptions():
     pipeline._report_progress("loading", {"source": "test.mp4"})
 
 
+def test_report_progress_accepts_async_callback():
+    """_report_progress should run coroutine-returning callbacks."""
+    received = []
+
+    async def async_callback(stage, data):
+        received.append((stage, data))
+
+    pipeline = TranscriptionPipeline(on_progress=async_callback)
+
+    # No progress loop configured - the coroutine runs to completion inline
+    pipeline._report_progress("loading", {"source": "test.mp4"})
+
+    assert received == [("loading", {"source": "test.mp4"})]
+
+
 def test_report_progress_with_none_data():
     """_report_progress should handle None data parameter."""
-    callback = Mock()
-    pipeline = TranscriptionPipeline(on_progress=callback)
+    calls = []
+    pipeline = TranscriptionPipeline(on_progress=lambda stage, data: calls.append((stage, data)))
 
     # Call with None data
     pipeline._report_progress("loading", None)
 
     # Verify callback called with empty dict
-    callback.assert_called_once_with("loading", {})
+    assert calls == [("loading", {})]
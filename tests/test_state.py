@@ -47,6 +47,25 @@ def test_state_persistence(tmp_path):
     assert manager2.state.processed_videos[0].video_id == "test123"
 
 
+def test_add_processed_appends_to_wal_without_snapshot(tmp_path):
+    """add_processed should append one WAL line, not rewrite state.json."""
+    manager = StateManager(tmp_path / "session")
+    manager.save()
+    snapshot_before = manager.state_file.read_bytes()
+
+    result = VideoProcessingResult(
+        video_id="test123",
+        source="https://example.com/video",
+        status="success",
+    )
+    manager.add_processed(result)
+
+    # Result went to the WAL; the snapshot is untouched
+    assert manager.wal_file.exists()
+    assert len(manager.wal_file.read_bytes().splitlines()) == 1
+    assert manager.state_file.read_bytes() == snapshot_before
+
+
 def test_is_already_processed(tmp_path):
     """Test checking if video is already processed."""
     manager = StateManager(tmp_path / "session")
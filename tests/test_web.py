@@ -7,52 +7,45 @@ import pytest  # type: ignore
 from amplifier_app_transcribe.web import launch_web_ui
 
 
-def test_launch_web_ui_spawns_streamlit(mocker, tmp_path):
-    """launch_web_ui should spawn streamlit subprocess."""
-    mock_run = mocker.patch("subprocess.run")
-
-    # Mock streamlit import check
-    mocker.patch.dict("sys.modules", {"streamlit": Mock()})
-
-    # Create actual _web_app.py file for test
-    mock_web_file = tmp_path / "web.py"
+def test_launch_web_ui_runs_streamlit_in_process(mocker, tmp_path):
+    """launch_web_ui should start the server via Streamlit's bootstrap API."""
+    mock_bootstrap = Mock()
+
+    # Mock the streamlit presence probe (find_spec needs __spec__ set)
+    # and the lazily imported bootstrap module
+    mock_streamlit = Mock()
+    mock_streamlit.__spec__ = Mock()
+    mocker.patch.dict(
+        "sys.modules",
+        {
+            "streamlit": mock_streamlit,
+            "streamlit.web": Mock(bootstrap=mock_bootstrap),
+            "streamlit.web.bootstrap": mock_bootstrap,
+        },
+    )
+
+    # Point the module-level app path at an actual file
     mock_app_file = tmp_path / "_web_app.py"
     mock_app_file.write_text("# Mock Streamlit app")
-
-    # Mock __file__ to point to our temp directory
-    mocker.patch("amplifier_app_transcribe.web.__file__", str(mock_web_file))
+    mocker.patch("amplifier_app_transcribe.web._APP_FILE", mock_app_file)
 
     launch_web_ui()
 
-    # Verify subprocess.run was called
-    mock_run.assert_called_once()
-    args = mock_run.call_args[0][0]
-
-    # Verify command structure
-    assert any("streamlit" in str(arg) for arg in args)
-    assert "run" in args
+    # Verify bootstrap.run was called with the app file
+    mock_bootstrap.run.assert_called_once()
+    args = mock_bootstrap.run.call_args[0]
     assert any("_web_app.py" in str(arg) for arg in args)
 
 
-def test_launch_web_ui_fails_if_streamlit_missing(mocker):
+def test_launch_web_ui_fails_if_streamlit_missing(mocker, tmp_path):
     """launch_web_ui should raise error if streamlit not installed."""
-    # Mock _web_app.py exists
-    mock_path = mocker.patch("amplifier_app_transcribe.web.Path")
-    mock_app_file = Mock()
-    mock_app_file.exists.return_value = True
-    mock_path.return_value.__truediv__.return_value = mock_app_file
-
-    # Simulate ImportError when importing streamlit
-    import builtins
-
-    real_import = builtins.__import__
-
-    def mock_import(name, *args, **kwargs):
-        if name == "streamlit":
-            raise ImportError("No module named 'streamlit'")
-        return real_import(name, *args, **kwargs)
+    # Point the module-level app path at an actual file
+    mock_app_file = tmp_path / "_web_app.py"
+    mock_app_file.write_text("# Mock Streamlit app")
+    mocker.patch("amplifier_app_transcribe.web._APP_FILE", mock_app_file)
 
-    mocker.patch("builtins.__import__", side_effect=mock_import)
+    # Simulate streamlit being absent from the finder chain
+    mocker.patch("importlib.util.find_spec", return_value=None)
 
     with pytest.raises(RuntimeError, match="Streamlit not installed"):
         launch_web_ui()
@@ -60,9 +53,8 @@ def test_launch_web_ui_fails_if_streamlit_missing(mocker):
 
 def test_launch_web_ui_fails_if_app_file_missing(mocker, tmp_path):
     """launch_web_ui should raise error if _web_app.py missing."""
-    # Mock __file__ to point to temp directory (no _web_app.py there)
-    mock_web_file = tmp_path / "web.py"
-    mocker.patch("amplifier_app_transcribe.web.__file__", str(mock_web_file))
+    # Point the module-level app path at a file that does not exist
+    mocker.patch("amplifier_app_transcribe.web._APP_FILE", tmp_path / "_web_app.py")
 
     # Mock streamlit available
     mocker.patch.dict("sys.modules", {"streamlit": Mock()})